@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : payload and latency of navigating forth and back
+# Usage     : python benchmarks/back_navigation.py
+
+# Standard Libraries
+import time
+from typing import List, Tuple, Callable
+
+# Local Libraries
+from harness import make_page
+from main import FletGrm
+from views import route_stack, build_view, reconcile_views
+
+# Navigation : menu -> chat -> profile -> back -> back (first chat
+# of data is opened)
+NAVIGATION: List[str] = [
+    "/menu",
+    "/chat/{chat}",
+    "/profile/{chat}",
+    "/chat/{chat}",
+    "/menu"
+]
+
+def rebuild_views(page, route: str) -> None:
+    """
+    Function to clear views and build whole views stack again
+    (old route change)
+
+    :params:
+        page  : Flet page
+        route : Requested route
+
+    :return: None
+    """
+    page.views.clear()
+    page.views.extend(
+        build_view(page, path) for path in route_stack(page, route)
+    )
+
+def navigate(page, show: Callable) -> List[Tuple[str, int, float]]:
+    """
+    Function to walk through navigation and measure each step
+
+    :params:
+        page : Flet page
+        show : Function to put route views on page
+
+    :return: List of (route, sent bytes, milliseconds)
+    """
+    results: List[Tuple[str, int, float]] = []
+    chat: str = page.chat_registry.chats[0]["id"]
+    page.database["last_page"] = f"/chat/{chat}"
+    for route in (route.format(chat=chat) for route in NAVIGATION):
+        sent: int = page.connection.sent_bytes
+        start: float = time.perf_counter()
+        show(page, route)
+        page.update()
+        results.append((
+            route,
+            page.connection.sent_bytes - sent,
+            (time.perf_counter() - start) * 1000
+        ))
+    return results
+
+def main() -> None:
+    """
+    Compare rebuilding views on every navigation with keeping
+    views which are still in place
+
+    :return: None
+    """
+    page = make_page()
+    FletGrm(page)
+    time.sleep(0.5)
+
+    # Warm up view cache so reconcile only measures views stack
+    navigate(page, lambda page, route: reconcile_views(page, route))
+
+    print(f"{"route":<22} {"rebuild (B)":>12} {"ms":>7} {"reconcile (B)":>14} {"ms":>7}")
+    for old, new in zip(
+        navigate(page, rebuild_views),
+        navigate(page, lambda page, route: reconcile_views(page, route))
+    ):
+        print(f"{old[0]:<22} {old[1]:>12} {old[2]:>7.2f} {new[1]:>14} {new[2]:>7.2f}")
+
+if __name__ == "__main__":
+    main()
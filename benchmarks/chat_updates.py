@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : diff size and latency of chat input actions and sends
+# Usage     : python benchmarks/chat_updates.py [messages] [rounds]
+
+# Standard Libraries
+import os
+import sys
+import time
+import tempfile
+from typing import Any, Callable, Dict, List
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from harness import make_page
+from fixtures import generate
+from main import FletGrm
+from pages.libs.message import MessageRow
+
+def actions(page: ft.Page) -> Dict[str, Callable[[], None]]:
+    """
+    Function to return input actions of shown chat page (focus and
+    blur of message input and sending a message)
+
+    :params: page : Flet page (chat is shown)
+    :return: Action name -> action
+    """
+    bottom_app: ft.Container = page.views[-1].controls[-1]
+    message_input: ft.CupertinoTextField = bottom_app.content.controls[1]
+    send_button: ft.IconButton = bottom_app.content.controls[4]
+
+    def send() -> None:
+        message_input.value = "Did you catch the game last night?"
+        send_button.on_click(None)
+
+    def blur() -> None:
+        message_input.value = ""
+        message_input.on_blur(None)
+
+    return {
+        "focus": lambda: message_input.on_focus(None),
+        "blur": blur,
+        "send": send
+    }
+
+def run(page: ft.Page, rounds: int) -> Dict[str, Dict[str, float]]:
+    """
+    Function to run actions (focus, blur, send) some rounds and
+    measure what is sent to client and how long handlers take
+    (marked controls are flushed right after every action)
+
+    :params:
+        page   : Flet page (chat is shown)
+        rounds : Number of rounds
+
+    :return: Action name -> mean bytes and milliseconds
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for _ in range(rounds):
+        for name, action in actions(page).items():
+            sent: int = page.connection.sent_bytes
+            start: float = time.perf_counter()
+            action()
+            page.scheduler.flush()
+            result: Dict[str, float] = results.setdefault(name, {"bytes": 0, "ms": 0})
+            result["bytes"] += (page.connection.sent_bytes - sent) / rounds
+            result["ms"] += (time.perf_counter() - start) * 1000 / rounds
+    return results
+
+def main(messages: int, rounds: int) -> None:
+    """
+    Compare targeted updates of chat handlers (shown messages are
+    isolated) with diffing whole page and every message on every
+    update (old page.update() calls), on a chat with a long history
+
+    :params:
+        messages : Number of messages in chat
+        rounds   : Rounds of every action
+
+    :return: None
+    """
+    directory: str = tempfile.mkdtemp()
+    generate(directory, chats=1, min_messages=messages, max_messages=messages, pinned=1)
+    os.chdir(directory)
+
+    page: ft.Page = make_page()
+    FletGrm(page)
+
+    # Keep sent messages in outbox, acks would update messages
+    # while actions are measured
+    page.outbox.transport.online = False
+    time.sleep(0.5)
+    page.go(f"/chat/{page.chat_registry.chats[0]["id"]}")
+    time.sleep(0.5)
+
+    # Targeted updates (as handlers do)
+    targeted: Dict[str, Dict[str, float]] = run(page, rounds)
+
+    # Whole page is diffed on every update, into every message
+    update: Callable[..., Any] = page.update
+    is_isolated: Callable[[MessageRow], bool] = MessageRow.is_isolated
+    page.update = lambda *controls: update()
+    MessageRow.is_isolated = lambda self: False
+    whole: Dict[str, Dict[str, float]] = run(page, rounds)
+    page.update = update
+    MessageRow.is_isolated = is_isolated
+
+    print(f"chat with {messages} messages, {rounds} rounds")
+    print(f"{"action":<8} {"page (B)":>9} {"page (ms)":>10} {"targeted (B)":>13} {"targeted (ms)":>14}")
+    for name in targeted:
+        print(
+            f"{name:<8} {whole[name]["bytes"]:>9.0f} {whole[name]["ms"]:>10.2f} "
+            f"{targeted[name]["bytes"]:>13.0f} {targeted[name]["ms"]:>14.2f}"
+        )
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    )
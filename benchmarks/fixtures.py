@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Fixtures : deterministic data/ directories at any scale
+# Usage    : python benchmarks/fixtures.py OUTPUT [--chats N] [--min-messages N]
+#            [--max-messages N] [--folders NAME=WEIGHT,...] [--stories RATIO]
+#            [--pinned N] [--seed N]
+#
+# Benchmarks run against a fixture when FLETGRM_FIXTURES=OUTPUT is set
+
+# Standard Libraries
+import os
+import sys
+import json
+import math
+import shutil
+import random
+import argparse
+import itertools
+from typing import Any, Dict, Iterator, List, Optional
+
+# Local Libraries
+from harness import ROOT, CWD
+
+# Common words of messages (most common first), rare words are made
+# from syllables, words are picked with Zipf weights
+COMMON: List[str] = """
+the i you to a and it is that of in what have do we for my me
+so are was this on just can be with your know not like how all
+but good today time think see get will at about one really going
+yeah yes no did what's want movie music weekend plan dinner trip
+book game weather coffee morning later tonight work home friend
+new great love sounds fun let's maybe sure thanks night day week
+""".split()
+SYLLABLES: List[str] = [
+    "ka", "lo", "mi", "ten", "ra", "su", "ver", "no", "pa", "li",
+    "dor", "en", "ti", "sa", "mo", "ber", "ze", "qua", "fi", "rol"
+]
+WORDS: List[str] = COMMON + [
+    "".join(parts) for parts in itertools.islice(
+        itertools.product(SYLLABLES, repeat=3), 20000
+    )
+]
+CUM_WEIGHTS: List[float] = list(
+    itertools.accumulate(1 / rank for rank in range(1, len(WORDS) + 1))
+)
+
+# Names of chats
+FIRST_NAMES: List[str] = [
+    "John", "Alice", "William", "Emma", "Noah", "Olivia", "Liam", "Sophia",
+    "James", "Mia", "Lucas", "Amelia", "Henry", "Ella", "Jack", "Grace"
+]
+LAST_NAMES: List[str] = [
+    "Doe", "Johnson", "Smith", "Brown", "Taylor", "Wilson", "Davies",
+    "Evans", "Thomas", "Roberts", "Walker", "Wright", "Green", "Hall"
+]
+MONTHS: List[str] = [
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December"
+]
+
+def message_text(rng: random.Random) -> str:
+    """
+    Function to return text of a message
+
+    :params: rng : Random generator
+    :return: Message text
+    """
+    words: List[str] = rng.choices(WORDS, cum_weights=CUM_WEIGHTS, k=rng.randint(2, 14))
+    return " ".join(words).capitalize() + rng.choice([".", "?", "!", ""])
+
+def messages(rng: random.Random, count: int) -> Iterator[Dict[str, Any]]:
+    """
+    Generator of chat history messages, days start with a system
+    date separator (like data/messages/*.json)
+
+    :params:
+        rng   : Random generator
+        count : Number of messages (separators included)
+
+    :return: Iterator of messages (oldest first)
+    """
+    day: int = rng.randrange(365)
+    minute: int = 0
+    for number in range(count):
+        # Start a new day (first message is always a separator)
+        if number == 0 or rng.random() < 0.02:
+            day += rng.randint(1, 3)
+            minute = rng.randrange(6 * 60, 12 * 60)
+            yield {
+                "role": "system",
+                "time": f"{MONTHS[day // 31 % 12]} {day % 31 + 1}"
+            }
+            continue
+
+        minute = min(minute + rng.randint(0, 5), 24 * 60 - 1)
+        hour: int = minute // 60
+        yield {
+            "role": rng.choice(["self", "partner"]),
+            "message": message_text(rng),
+            "time": f"{(hour - 1) % 12 + 1}:{minute % 60:02} {"AM" if hour < 12 else "PM"}",
+            "seen": number < count - 3 or rng.random() < 0.5
+        }
+
+def write_history(path: str, history: Iterator[Dict[str, Any]]) -> int:
+    """
+    Function to write a history export (JSON array, one message per
+    line) without keeping it in memory
+
+    :params:
+        path    : Export path
+        history : Messages to write
+
+    :return: Number of written messages
+    """
+    count: int = 0
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("[\n")
+        for count, message in enumerate(history, start=1):
+            file.write(("," if count > 1 else "") + json.dumps(message, ensure_ascii=False) + "\n")
+        file.write("]\n")
+    return count
+
+def make_chat(rng: random.Random,
+              folders: Dict[str, float],
+              stories: float) -> Dict[str, Any]:
+    """
+    Function to return a chat (like data/chats.json)
+
+    :params:
+        rng     : Random generator
+        folders : Folder name -> weight
+        stories : Ratio of chats with a story
+
+    :return: Chat
+    """
+    chat_id: str = str(rng.randrange(10 ** 9, 10 ** 11))
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    has_story: bool = rng.random() < stories
+    return {
+        "profile": f"https://i.pravatar.cc/150?u={chat_id}" if rng.random() < 0.8 else None,
+        "name": f"{first} {last}",
+        "id": chat_id,
+        "phone_number": None,
+        "username": f"{first}_{last}_{rng.randrange(100)}".lower() if rng.random() < 0.6 else None,
+        "birth": f"{MONTHS[rng.randrange(12)][:3]} {rng.randint(1, 28)}",
+        "status": rng.choice(["Online", "last seen recently", "last seen within a week"]),
+        "bio": message_text(rng),
+        "has_story": has_story,
+        "seen": rng.random() < 0.7,
+        "count": 0,
+        "pinned": False,
+        "muted": rng.random() < 0.2,
+        "story_seen": not has_story or rng.random() < 0.5,
+        "folder": rng.choices(list(folders), weights=list(folders.values()))[0],
+        "channel": None
+    }
+
+def generate(output: str,
+             chats: Optional[int] = 1000,
+             min_messages: Optional[int] = 10,
+             max_messages: Optional[int] = 10000,
+             folders: Optional[Dict[str, float]] = None,
+             stories: Optional[float] = 0.2,
+             pinned: Optional[int] = 3,
+             seed: Optional[int] = 0) -> Dict[str, Any]:
+    """
+    Function to write a data/ directory into output (same files as
+    repository data/, countries and palettes are copied), history
+    lengths are spread log-uniformly between min and max messages
+
+    :params:
+        output       : Output directory (data/ is made in it)
+        chats        : Number of chats
+        min_messages : Minimum history length
+        max_messages : Maximum history length
+        folders      : Folder name -> weight of chats in folder
+        stories      : Ratio of chats with a story
+        pinned       : Number of pinned chats
+        seed         : Random seed
+
+    :return: Fixture summary
+    """
+    rng: random.Random = random.Random(seed)
+    folders = folders or {"All Chats": 0.7, "Important": 0.2, "Bots": 0.1}
+    data: str = os.path.join(output, "data")
+    os.makedirs(os.path.join(data, "messages"), exist_ok=True)
+
+    # Copy static assets and user data (with generated folders)
+    for name in ("countries.json", "profile_palette.json"):
+        shutil.copy(os.path.join(ROOT, "data", name), os.path.join(data, name))
+    with open(os.path.join(ROOT, "data", "self.json"), "r") as file:
+        database: Dict[str, Any] = json.load(file)
+    database["folders"] = list(folders)
+    with open(os.path.join(data, "self.json"), "w") as file:
+        json.dump(database, file, indent=4)
+
+    # Write chats and their histories
+    chat_list: List[Dict[str, Any]] = [
+        make_chat(rng, folders, stories) for _ in range(chats)
+    ]
+    total: int = 0
+    for position, chat in enumerate(chat_list):
+        chat["pinned"] = position < pinned
+        length: int = round(math.exp(rng.uniform(
+            math.log(min_messages), math.log(max_messages)
+        )))
+        history: Iterator[Dict[str, Any]] = messages(
+            random.Random(f"{seed}:{chat["id"]}"), length
+        )
+        total += write_history(
+            os.path.join(data, "messages", f"{chat["id"]}.json"),
+            history
+        )
+        chat["count"] = rng.randrange(min(length, 50))
+    with open(os.path.join(data, "chats.json"), "w") as file:
+        json.dump(chat_list, file, indent=4, ensure_ascii=False)
+
+    return {"chats": chats, "messages": total, "path": data}
+
+def main(argv: List[str]) -> None:
+    """
+    Command line of fixture generator
+
+    :params: argv : Arguments
+    :return: None
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Generate a data/ directory for benchmarks"
+    )
+    parser.add_argument("output")
+    parser.add_argument("--chats", type=int, default=1000)
+    parser.add_argument("--min-messages", type=int, default=10)
+    parser.add_argument("--max-messages", type=int, default=10000)
+    parser.add_argument("--folders", default="All Chats=0.7,Important=0.2,Bots=0.1")
+    parser.add_argument("--stories", type=float, default=0.2)
+    parser.add_argument("--pinned", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    summary: Dict[str, Any] = generate(
+        output=os.path.join(CWD, args.output),
+        chats=args.chats,
+        min_messages=args.min_messages,
+        max_messages=args.max_messages,
+        folders={
+            name: float(weight) for name, weight in (
+                folder.split("=") for folder in args.folders.split(",")
+            )
+        },
+        stories=args.stories,
+        pinned=args.pinned,
+        seed=args.seed
+    )
+    print(f"{summary["chats"]} chats and {summary["messages"]} messages written to {summary["path"]}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
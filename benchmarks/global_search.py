@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : keystroke to results of global search
+# Usage     : python benchmarks/global_search.py [chats] [messages]
+
+# Standard Libraries
+import os
+import sys
+import time
+import random
+import tempfile
+import threading
+from typing import Any, Dict, List
+
+# Local Libraries
+from harness import ROOT
+from pages.libs.messageStore import MessageStore
+from pages.libs.globalSearch import GlobalSearch
+
+# Typed queries (every prefix of them is searched like keystrokes)
+QUERIES: List[str] = ["john", "good movie", "word12"]
+
+def main(chats: int, messages: int) -> None:
+    """
+    Measure time from every keystroke to first results (chats) and
+    to last results (messages) of global search
+
+    :params:
+        chats    : Number of chats
+        messages : Number of messages (spread over chats)
+
+    :return: None
+    """
+    random.seed(0)
+    names: List[str] = ["John", "Alice", "William", "Emma", "Noah", "Olivia"]
+    words: List[str] = ["good", "movie", "music", "weekend", "plan", "dinner", "game"] + [
+        f"word{number}" for number in range(5000)
+    ]
+    directory: str = tempfile.mkdtemp()
+    store: MessageStore = MessageStore(
+        path=os.path.join(directory, "bench.db"),
+        log_directory=os.path.join(directory, "logs")
+    )
+    chat_list: List[Dict[str, Any]] = [
+        {
+            "id": str(number),
+            "name": f"{random.choice(names)} {random.choice(names)}son",
+            "username": f"user_{number}"
+        }
+        for number in range(chats)
+    ]
+    for chat in chat_list:
+        store.log.append(chat["id"], [
+            {
+                "role": "self",
+                "message": " ".join(random.choices(words, k=8)),
+                "time": "10:00 AM",
+                "seen": True
+            }
+            for _ in range(messages // chats)
+        ])
+
+    search: GlobalSearch = GlobalSearch(store=store, chats=chat_list)
+    start: float = time.perf_counter()
+    for chat in chat_list:
+        store.message_index(chat["id"])
+    print(f"{chats} chats, {messages} messages, indexed in {time.perf_counter() - start:.1f} s")
+
+    print(f"{"keystroke":<14} {"first (ms)":>11} {"last (ms)":>10} {"messages":>9}")
+    for query in QUERIES:
+        for size in range(1, len(query) + 1):
+            done: threading.Event = threading.Event()
+            timings: Dict[str, float] = {}
+
+            def on_results(results: Dict[str, Any]) -> None:
+                elapsed: float = (time.perf_counter() - start) * 1000
+                timings.setdefault("first", elapsed)
+                if results["done"]:
+                    timings["last"] = elapsed
+                    timings["messages"] = len(results["messages"])
+                    done.set()
+
+            start = time.perf_counter()
+            search.search(query[:size], on_results)
+            done.wait()
+            print(f"{query[:size]:<14} {timings["first"]:>11.2f} {timings["last"]:>10.2f} {timings["messages"]:>9}")
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    )
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark harness : in-process Flet page without a client
+
+# Standard Libraries
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Self, NoReturn, List, Dict, Any, Callable
+
+# Run benchmarks from repository root (data paths are relative) or
+# from a fixture made by fixtures.py (FLETGRM_FIXTURES=<output>)
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CWD: str = os.getcwd()
+sys.path.insert(0, ROOT)
+os.chdir(os.environ.get("FLETGRM_FIXTURES", ROOT))
+
+# 3rd-party Libraries
+import flet as ft
+from flet_core.connection import Connection
+from flet_core.protocol import (
+    Command,
+    CommandEncoder,
+    PageCommandResponsePayload,
+    PageCommandsBatchResponsePayload
+)
+
+class LocalConnection(Connection):
+    """
+    Flet connection that answers page commands in-process and
+    records the size of every payload sent over the wire
+    """
+    def __init__(self: Self) -> NoReturn:
+        super().__init__()
+        self.page_url: str = "http://localhost"
+        self.next_id: int = 0
+        self.batches: int = 0
+        self.sent_bytes: int = 0
+
+    def send_command(self: Self,
+                     session_id: str,
+                     command: Command) -> PageCommandResponsePayload:
+        self.sent_bytes += len(json.dumps(command, cls=CommandEncoder))
+        return PageCommandResponsePayload(result="", error="")
+
+    def send_commands(self: Self,
+                      session_id: str,
+                      commands: List[Command]) -> PageCommandsBatchResponsePayload:
+        self.batches += 1
+        self.sent_bytes += len(json.dumps(commands, cls=CommandEncoder))
+
+        # Give an id to every added control (like the client does)
+        results: List[str] = []
+        for command in commands:
+            if command.name == "add":
+                ids: List[str] = []
+                for _ in command.commands:
+                    self.next_id += 1
+                    ids.append(f"_{self.next_id}")
+                results.append(" ".join(ids))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+def make_page(width: int = 370, height: int = 650) -> ft.Page:
+    """
+    Function to create a Flet page connected to a local connection
+
+    :params:
+        width  : Page width
+        height : Page height
+
+    :return: Flet page (page.connection is the LocalConnection)
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+    connection: LocalConnection = LocalConnection()
+    page: ft.Page = ft.Page(
+        connection, "benchmark", loop, ThreadPoolExecutor()
+    )
+    page._set_attr("width", width)
+    page._set_attr("height", height)
+    return page
+
+def measure(function: Callable[[], Any], rounds: int) -> Dict[str, float]:
+    """
+    Function to time a callable over some rounds
+
+    :params:
+        function : Callable to measure
+        rounds   : Number of rounds
+
+    :return: min/mean timings in milliseconds
+    """
+    timings: List[float] = []
+    for _ in range(rounds):
+        start: float = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min": min(timings),
+        "mean": sum(timings) / len(timings)
+    }
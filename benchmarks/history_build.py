@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : building chat history controls (insert(0) vs single pass)
+# Usage     : python benchmarks/history_build.py [messages ...]
+
+# Standard Libraries
+import sys
+import random
+from typing import Callable, Dict, List
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from harness import measure
+from fixtures import messages
+from pages.libs.messageRecord import Role, MessageRecord, HistoryBuffer
+from pages.libs.historyWindow import HistoryWindow
+
+def render(message: MessageRecord) -> List[ft.Control]:
+    """
+    Function to render a message with the same number of controls
+    as chat page (3 for date separators)
+
+    :params: message : Message
+    :return: Controls of message
+    """
+    if message.role is Role.SYSTEM:
+        return [ft.Text(height=5), ft.Text(message.time), ft.Text(height=5)]
+    return [ft.Text(message.message, key=str(message.seq))]
+
+def insert_build(buffer: HistoryBuffer,
+                 render: Callable[[MessageRecord], List[ft.Control]]) -> List[ft.Control]:
+    """
+    Function to build history controls like chat page did, every
+    control is inserted at first index of reversed list view
+
+    :params:
+        buffer : Messages (oldest first)
+        render : Message renderer
+
+    :return: Controls (newest first)
+    """
+    controls: List[ft.Control] = []
+    for message in buffer:
+        for control in reversed(render(message)):
+            controls.insert(0, control)
+    return controls
+
+def main(sizes: List[int]) -> None:
+    """
+    Compare insert(0) history build with single pass build of
+    history window, time per 1k messages should stay flat for
+    single pass and grow with history for insert(0), controls are
+    rendered before timing so only list building is measured
+
+    :params: sizes : History lengths
+    :return: None
+    """
+    print(f"{"messages":>9} {"case":<12} {"time (ms)":>10} {"per 1k (ms)":>12}")
+    for size in sizes:
+        buffer: HistoryBuffer = HistoryBuffer.from_messages(
+            messages(random.Random(0), size)
+        )
+        rendered: List[List[ft.Control]] = [render(message) for message in buffer]
+        window: HistoryWindow = HistoryWindow(
+            store=None,
+            chat_id="",
+            list_view=ft.ListView(),
+            render=lambda message: rendered[message.seq]
+        )
+        cases: Dict[str, Callable[[], List[ft.Control]]] = {
+            "insert(0)": lambda: insert_build(buffer, window.render),
+            "single pass": lambda: window.controls(buffer)[0]
+        }
+        assert [control.value for control in cases["insert(0)"]()] == [
+            control.value for control in cases["single pass"]()
+        ], "builds differ"
+        for name, function in cases.items():
+            elapsed: float = measure(function, rounds=3)["min"]
+            print(f"{size:>9} {name:<12} {elapsed:>10.1f} {elapsed / size * 1000:>12.3f}")
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10000, 100000])
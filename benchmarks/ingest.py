@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : throughput of incoming message bursts on an open chat
+# Usage     : python benchmarks/ingest.py [messages] [bursts]
+
+# Standard Libraries
+import os
+import sys
+import time
+import random
+import tempfile
+from typing import Any, Dict, Iterator, List
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from harness import make_page
+from fixtures import generate, messages
+from main import FletGrm
+
+def feed(rng: random.Random) -> Iterator[Dict[str, Any]]:
+    """
+    Generator of incoming messages (fake local feed), fixture
+    separators become "date" of following messages
+
+    :params: rng : Random generator
+    :return: Iterator of incoming messages
+    """
+    date: str = ""
+    while True:
+        for message in messages(rng, 1000):
+            if message["role"] == "system":
+                date = message["time"]
+            else:
+                yield message | {"date": date}
+
+def main(count: int, bursts: int) -> None:
+    """
+    Deliver incoming messages to an open chat one by one (every
+    message is stored, rendered and flushed alone) and in bursts
+    of growing size, report messages per second and round trips
+    to client per burst
+
+    :params:
+        count  : Number of messages in chat before feed
+        bursts : Bursts of every size
+
+    :return: None
+    """
+    directory: str = tempfile.mkdtemp()
+    generate(directory, chats=1, min_messages=count, max_messages=count, pinned=1)
+    os.chdir(directory)
+
+    page: ft.Page = make_page()
+    FletGrm(page)
+    time.sleep(0.5)
+    chat_id: str = page.chat_registry.chats[0]["id"]
+    page.go(f"/chat/{chat_id}")
+    time.sleep(0.5)
+
+    incoming: Iterator[Dict[str, Any]] = feed(random.Random(0))
+    print(f"chat with {count} messages, {bursts} bursts of every size")
+    print(f"{"burst":>6} {"messages/s":>11} {"trips/burst":>12} {"ms/burst":>9}")
+    for size in (1, 10, 100, 1000, 5000):
+        batches: int = page.connection.batches
+        elapsed: float = 0.0
+        for _ in range(bursts):
+            burst: List[Dict[str, Any]] = [next(incoming) for _ in range(size)]
+            start: float = time.perf_counter()
+            page.chat_registry.deliver(chat_id, burst)
+            elapsed += time.perf_counter() - start
+        print(
+            f"{size:>6} {size * bursts / elapsed:>11.0f} "
+            f"{(page.connection.batches - batches) / bursts:>12.1f} "
+            f"{elapsed * 1000 / bursts:>9.2f}"
+        )
+
+    # Window must end with latest messages of store
+    history: Any = page.views[-1].controls[2].data
+    print(
+        f"window [{history.start}, {history.stop}) of {page.message_store.count(chat_id)} "
+        f"messages, pool: {page.message_pool.summary()}"
+    )
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    )
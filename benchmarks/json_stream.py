@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : reading large exported histories (json.load vs streaming)
+# Usage     : python benchmarks/json_stream.py [messages]
+
+# Standard Libraries
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, Tuple
+
+# Local Libraries
+from fixtures import messages, write_history
+from pages.libs.jsonStream import iter_array, tail_array
+
+# Messages needed for the first screen of chat
+FIRST_SCREEN: int = 30
+
+def profile(function: Callable[[], Any]) -> Tuple[float, float]:
+    """
+    Function to measure time and peak memory of a callable
+
+    :params: function : Callable to measure
+    :return: Time (ms) and peak memory (MiB)
+    """
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    function()
+    elapsed: float = (time.perf_counter() - start) * 1000
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+def main(count: int) -> None:
+    """
+    Compare json.load with streaming reader for the first screen
+    of a chat (last messages) and for a full pass over history
+
+    :params: count : Number of messages in export
+    :return: None
+    """
+    path: str = os.path.join(tempfile.mkdtemp(), "history.json")
+    write_history(path, messages(random.Random(0), count))
+    print(f"export: {count} messages, {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "first screen, json.load": lambda: json.load(open(path))[-FIRST_SCREEN:],
+        "first screen, tail_array": lambda: tail_array(path, FIRST_SCREEN),
+        "full pass, json.load": lambda: deque(json.load(open(path)), maxlen=0),
+        "full pass, iter_array": lambda: deque(iter_array(path), maxlen=0)
+    }
+    print(f"{"case":<28} {"time (ms)":>10} {"peak (MiB)":>11}")
+    for name, function in cases.items():
+        elapsed, peak = profile(function)
+        print(f"{name:<28} {elapsed:>10.1f} {peak:>11.2f}")
+    os.remove(path)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
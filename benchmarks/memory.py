@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : memory per message of history representations
+# Usage     : python benchmarks/memory.py [messages]
+
+# Standard Libraries
+import sys
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List
+
+# Local Libraries
+from harness import ROOT
+from pages.libs.messageRecord import MessageRecord, HistoryBuffer
+
+# Times of a day (like "10:30 AM")
+TIMES: List[str] = [
+    f"{hour}:{minute:02} {half}"
+    for half in ("AM", "PM") for hour in range(1, 13) for minute in range(60)
+]
+
+def history(messages: int) -> Iterator[Dict[str, Any]]:
+    """
+    Generator of message dicts as they are parsed from history
+    (every dict is decoded from it's own JSON line)
+
+    :params: messages : Number of messages
+    :return: Iterator of message dicts
+    """
+    for number in range(messages):
+        if number % 50 == 0:
+            line: str = json.dumps({"role": "system", "time": "August 12"})
+        else:
+            line = json.dumps({
+                "role": "partner" if number % 2 else "self",
+                "message": f"Message {number}",
+                "time": TIMES[number // 50 % len(TIMES)],
+                "seen": True
+            })
+        yield json.loads(line)
+
+def allocated(function: Callable[[], Any]) -> int:
+    """
+    Function to measure memory held by result of a callable
+
+    :params: function : Callable to measure
+    :return: Allocated bytes
+    """
+    tracemalloc.start()
+    result: Any = function()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+def main(messages: int) -> None:
+    """
+    Compare bytes per message of message dicts (today's
+    representation), slotted records and columnar buffer
+
+    :params: messages : Number of messages in history
+    :return: None
+    """
+    cases: Dict[str, Callable[[], Any]] = {
+        "dicts": lambda: list(history(messages)),
+        "slotted records": lambda: [
+            MessageRecord.from_dict(message) for message in history(messages)
+        ],
+        "history buffer": lambda: HistoryBuffer.from_messages(history(messages))
+    }
+    print(f"history: {messages} messages")
+    print(f"{"representation":<18} {"total (MiB)":>12} {"bytes/message":>14}")
+    for name, function in cases.items():
+        size: int = allocated(function)
+        print(f"{name:<18} {size / 2 ** 20:>12.1f} {size / messages:>14.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : allocations and wire size of message controls (build vs rebind)
+# Usage     : python benchmarks/message_build.py [messages]
+
+# Standard Libraries
+import sys
+import json
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+# 3rd-party Libraries
+import flet as ft
+from flet_core.protocol import CommandEncoder
+
+# Local Libraries
+from harness import make_page, measure
+from fixtures import messages
+from pages.libs.message import Message
+from pages.libs.layoutCache import LayoutCache
+
+def legacy_build(message: Message) -> ft.Row:
+    """
+    Function to build a message like Message.build did, before
+    styles were shared (new style objects for every message and a
+    column around time)
+
+    :params: message : Message
+    :return: Message control
+    """
+    return ft.Row(
+        key=message.key,
+        alignment="end" if message.role == "self" else "start",
+        controls=[
+            ft.Container(
+                padding=10,
+                gradient=ft.LinearGradient(
+                    begin=ft.alignment.top_center,
+                    end=ft.alignment.bottom_center,
+                    colors=[
+                        "#00364f", "#0e141a"
+                    ] if message.role == "partner" else [
+                        "#2b5f86", "#306894"
+                    ],
+                ),
+                shadow=ft.BoxShadow(
+                    spread_radius=0,
+                    blur_radius=10,
+                    color="#10000000",
+                    offset=ft.Offset(0, 0),
+                    blur_style=ft.ShadowBlurStyle.SOLID,
+                ),
+                content=ft.Row(
+                    alignment="space_between",
+                    spacing=5,
+                    wrap=True,
+                    run_spacing=1,
+                    width=message.page.width / 1.26 if len(message.message) > 40 else None,
+                    controls=[
+                        ft.Text(
+                            value=message.message,
+                        ),
+                        ft.Column(
+                            spacing=0,
+                            alignment=ft.MainAxisAlignment.START,
+                            controls=[
+                                ft.Text(
+                                    value=message.time,
+                                    color="#bbbbbb"
+                                )
+                            ]
+                        ),
+                        ft.Icon(
+                            name="done_all" if message.seen else "check",
+                            size=16
+                        )
+                    ]
+                ),
+                border_radius=ft.border_radius.only(
+                    7, 7, 0, 7
+                ) if message.role == "partner" else ft.border_radius.only(
+                    7, 7, 7, 0
+                )
+            )
+        ]
+    )
+
+def allocated(function: Callable[[], Any]) -> int:
+    """
+    Function to return memory held by result of a callable
+
+    :params: function : Callable to measure
+    :return: Allocated bytes
+    """
+    tracemalloc.start()
+    result: Any = function()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+def wire_size(controls: List[ft.Control]) -> int:
+    """
+    Function to return size of add commands of controls (what is
+    sent to client when they are added to page)
+
+    :params: controls : Controls to send
+    :return: Payload size in bytes
+    """
+    return sum(
+        len(json.dumps(control._build_add_commands(), cls=CommandEncoder))
+        for control in controls
+    )
+
+def main(count: int) -> None:
+    """
+    Compare legacy message build, shared style build and pooled
+    controls rebound to messages, per message allocations,
+    controls, wire size and build time
+
+    :params: count : Number of messages
+    :return: None
+    """
+    page: ft.Page = make_page()
+    page.layout_cache = LayoutCache(page)
+    history: List[Message] = [
+        Message(
+            message=message["message"],
+            time=message["time"],
+            role=message["role"],
+            seen=message["seen"],
+            page=page,
+            key=str(seq)
+        )
+        for seq, message in enumerate(messages(random.Random(0), count))
+        if message["role"] != "system"
+    ]
+
+    # Pooled controls are rebound to other messages
+    pooled: List[ft.Row] = [message.build() for message in reversed(history)]
+    cases: Dict[str, Callable[[], List[ft.Row]]] = {
+        "legacy": lambda: [legacy_build(message) for message in history],
+        "shared styles": lambda: [message.build() for message in history],
+        "pool rebind": lambda: [
+            message.bind(control) for message, control in zip(history, pooled)
+        ]
+    }
+
+    print(f"{len(history)} messages")
+    print(f"{"case":<14} {"alloc (B)":>10} {"controls":>9} {"wire (B)":>9} {"build (us)":>11}")
+    for name, build in cases.items():
+        memory: int = allocated(build)
+        controls: List[ft.Row] = build()
+        commands: int = sum(len(control._build_add_commands()) for control in controls)
+        timing: float = measure(build, rounds=3)["min"]
+        print(
+            f"{name:<14} {memory / len(history):>10.0f} {commands / len(history):>9.1f} "
+            f"{wire_size(controls) / len(history):>9.0f} {timing / len(history) * 1000:>11.1f}"
+        )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
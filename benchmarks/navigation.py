@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : per-navigation view building latency
+# Usage     : python benchmarks/navigation.py [rounds]
+
+# Standard Libraries
+import sys
+import time
+from typing import Dict, List
+
+# Local Libraries
+from harness import make_page, measure
+from main import FletGrm
+from views import ROUTES, match_route
+
+# Navigated routes (one per route template, first chat of data is
+# opened)
+NAVIGATION: List[str] = [
+    "/login",
+    "/otpauth",
+    "/menu",
+    "/chat/{chat}",
+    "/profile/{chat}"
+]
+
+def build(page, route: str):
+    """
+    Function to build the view of a route (without view cache)
+
+    :params:
+        page  : Flet page
+        route : Route to build
+
+    :return: Built view
+    """
+    pattern, params = match_route(route)
+    return ROUTES[pattern](page, **params)
+
+def main(rounds: int) -> None:
+    """
+    Compare building every view on each navigation (old
+    view_handler behaviour) with building the requested one
+
+    :params: rounds : Number of navigations per route
+    :return: None
+    """
+    page = make_page()
+    FletGrm(page)
+    time.sleep(0.5)
+    chat: str = page.chat_registry.chats[0]["id"]
+    routes: List[str] = [route.format(chat=chat) for route in NAVIGATION]
+
+    print(f"{"route":<20} {"all pages (ms)":>15} {"one page (ms)":>15}")
+    for route in routes:
+        every: Dict[str, float] = measure(
+            lambda: {path: build(page, path) for path in routes}[route],
+            rounds
+        )
+        single: Dict[str, float] = measure(
+            lambda: build(page, route),
+            rounds
+        )
+        print(f"{route:<20} {every["mean"]:>15.2f} {single["mean"]:>15.2f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : round trips and latency of laying out a chat on resize
+# Usage     : python benchmarks/resize.py [events] [interval ms]
+
+# Standard Libraries
+import sys
+import time
+import types
+from typing import Any, Callable, Dict, List
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from harness import make_page
+from main import FletGrm
+
+def drag(page: ft.Page,
+         resized: Callable[[Any], None],
+         widths: List[float],
+         interval: float) -> Dict[str, float]:
+    """
+    Function to send resize events like a window drag (or phone
+    rotation) does and wait for layout
+
+    :params:
+        page     : Flet page (chat is shown)
+        resized  : Resize handler
+        widths   : Page widths of events
+        interval : Time between events (seconds)
+
+    :return: Round trips, sent bytes and handler milliseconds
+    """
+    batches: int = page.connection.batches
+    sent: int = page.connection.sent_bytes
+    elapsed: float = 0.0
+    for width in widths:
+        page._set_attr("width", width)
+        start: float = time.perf_counter()
+        resized(types.SimpleNamespace(width=width, height=page.height))
+        elapsed += time.perf_counter() - start
+        time.sleep(interval)
+    time.sleep(page.layout_cache.debounce * 2)
+    return {
+        "trips": page.connection.batches - batches,
+        "bytes": page.connection.sent_bytes - sent,
+        "ms": elapsed * 1000
+    }
+
+def main(events: int, interval: float) -> None:
+    """
+    Compare debounced and bucketed layout of resize events with
+    laying out every event right away, on an open chat (widths
+    of shown long messages must follow page width)
+
+    :params:
+        events   : Resize events of a drag
+        interval : Time between events (milliseconds)
+
+    :return: None
+    """
+    page: ft.Page = make_page()
+    FletGrm(page)
+    time.sleep(0.5)
+    page.go(f"/chat/{page.chat_registry.chats[0]["id"]}")
+    time.sleep(0.5)
+
+    widths: List[float] = [370 + step * 3.7 for step in range(1, events + 1)]
+    layout: Any = page.layout_cache
+    results: Dict[str, Dict[str, float]] = {
+        "debounced": drag(page, layout.resized, widths, interval / 1000)
+    }
+
+    # Every event is laid out right away (1 px buckets)
+    layout.bucket_size = 1
+    results["every event"] = drag(
+        page, lambda e: layout.layout(e.width), list(reversed(widths)), interval / 1000
+    )
+
+    rows: List[ft.Row] = [
+        control.controls[0].content for control in page.views[-1].controls[2].controls
+        if isinstance(control, ft.Row) and control.key
+    ]
+    print(f"{events} events every {interval} ms, {layout.summary()["tracked"]} controls in layout")
+    print(f"{"case":<12} {"trips":>6} {"sent (B)":>9} {"handler (ms)":>13}")
+    for name, result in results.items():
+        print(f"{name:<12} {result["trips"]:>6} {result["bytes"]:>9} {result["ms"]:>13.2f}")
+    print(
+        "long messages follow page width:",
+        all(row.width == layout.width(1.26) for row in rows if row.width is not None)
+    )
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    )
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : in-chat message search (inverted index vs scanning)
+# Usage     : python benchmarks/search.py [messages]
+
+# Standard Libraries
+import sys
+import random
+from typing import Dict, List
+
+# Local Libraries
+from harness import measure
+from pages.libs.searchIndex import MessageIndex, tokenize
+
+# Searched queries (last word is typed partly)
+QUERIES: List[str] = ["mov", "movie", "good mov", "weekend plan", "zzz"]
+
+def main(messages: int) -> None:
+    """
+    Compare searching a chat with the message index and with
+    scanning every message
+
+    :params: messages : Number of messages in chat
+    :return: None
+    """
+    random.seed(0)
+    common: List[str] = [
+        "movie", "music", "weekend", "plan", "dinner", "good", "trip",
+        "book", "game", "weather", "coffee", "morning", "today", "later"
+    ]
+    rare: List[str] = [f"word{number}" for number in range(5000)]
+    history: List[Dict[str, object]] = [
+        {
+            "seq": seq,
+            "message": " ".join(
+                random.choices(common + rare, [200] * len(common) + [1] * len(rare), k=8)
+            )
+        }
+        for seq in range(messages)
+    ]
+
+    index: MessageIndex = MessageIndex()
+    build: Dict[str, float] = measure(lambda: index.extend(history), 1)
+    print(f"index: {messages} messages, {len(index.terms)} terms, built in {build["mean"]:.0f} ms")
+
+    def scan(query: str) -> List[int]:
+        tokens: List[str] = tokenize(query)
+        return [
+            message["seq"] for message in reversed(history)
+            if all(
+                any(word.startswith(token) for word in tokenize(message["message"]))
+                for token in tokens
+            )
+        ]
+
+    print(f"{"query":<14} {"results":>8} {"index (ms)":>11} {"scan (ms)":>10}")
+    for query in QUERIES:
+        results: int = len(index.search(query))
+        indexed: Dict[str, float] = measure(lambda: index.search(query, limit=50), 50)
+        scanned: Dict[str, float] = measure(lambda: scan(query), 1)
+        print(f"{query:<14} {results:>8} {indexed["mean"]:>11.3f} {scanned["mean"]:>10.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
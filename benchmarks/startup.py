@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : cold start to first /login frame (JSON vs startup snapshot)
+# Usage     : python benchmarks/startup.py [rounds]
+
+# Standard Libraries
+import sys
+import subprocess
+from typing import Dict, List
+
+# Local Libraries
+from harness import ROOT, measure
+from pages.libs.assetCache import assets, load_json
+from pages.libs.startupSnapshot import STARTUP_ASSETS, load_snapshot
+
+# Code run in a fresh interpreter for every start, it prints time
+# from importing app to first /login frame
+START: str = """
+import sys, time
+sys.argv = ["startup"]
+from harness import make_page
+page = make_page()
+import pages.libs.startupSnapshot as startup
+if {disabled}:
+    startup.load_snapshot = lambda *args, **kwargs: None
+start = time.perf_counter()
+from main import FletGrm
+FletGrm(page)
+print((time.perf_counter() - start) * 1000)
+"""
+
+def cold_start(disabled: bool) -> float:
+    """
+    Function to start app in a new process
+
+    :params: disabled : Start without snapshot (parse JSON files)
+    :return: Time to first /login frame in milliseconds
+    """
+    output: str = subprocess.run(
+        [sys.executable, "-c", START.format(disabled=disabled)],
+        cwd=f"{ROOT}/benchmarks",
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return float(output.split()[-1])
+
+def load_assets() -> None:
+    """
+    Function to parse startup assets with an empty asset cache
+
+    :params: None
+    :return: None
+    """
+    assets.clear()
+    for source in STARTUP_ASSETS:
+        load_json(source)
+
+def load_snapshot_assets() -> None:
+    """
+    Function to load startup assets from snapshot with an empty
+    asset cache
+
+    :params: None
+    :return: None
+    """
+    assets.clear()
+    load_snapshot(path="./data/startup.snapshot")
+
+def main(rounds: int) -> None:
+    """
+    Compare cold start with and without startup snapshot (message
+    store and snapshot are made by a first start), and loading of
+    startup assets alone
+
+    :params: rounds : Number of starts per case
+    :return: None
+    """
+    cold_start(disabled=False)
+
+    print(f"{"case":<24} {"min (ms)":>10} {"mean (ms)":>10}")
+    for name, disabled in (("cold start, json", True), ("cold start, snapshot", False)):
+        timings: List[float] = [cold_start(disabled) for _ in range(rounds)]
+        print(f"{name:<24} {min(timings):>10.2f} {sum(timings) / rounds:>10.2f}")
+
+    for name, function in (("assets, json", load_assets), ("assets, snapshot", load_snapshot_assets)):
+        timing: Dict[str, float] = measure(function, rounds * 10)
+        print(f"{name:<24} {timing["min"]:>10.2f} {timing["mean"]:>10.2f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmark : round trips of handler bursts (scheduled vs direct updates)
+# Usage     : python benchmarks/update_bursts.py [rounds]
+
+# Standard Libraries
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from harness import make_page
+from main import FletGrm
+
+def find(control: ft.Control, kind: type) -> List[ft.Control]:
+    """
+    Function to find controls of a type under a control
+
+    :params:
+        control : Root control
+        kind    : Control type
+
+    :return: Found controls (in tree order)
+    """
+    found: List[ft.Control] = [control] if isinstance(control, kind) else []
+    for child in control._get_children():
+        found += find(child, kind)
+    return found
+
+def actions(page: ft.Page) -> Dict[str, Callable[[], None]]:
+    """
+    Function to return bursts of login page (typing a phone number
+    on dial keyboard and selecting a country)
+
+    :params: page : Flet page (login is shown)
+    :return: Action name -> action
+    """
+    buttons: List[ft.TextButton] = find(page.views[-1], ft.TextButton)
+    country: ft.TextButton = [
+        button for button in buttons if button.width == page.width
+    ][0]
+    dial: List[ft.TextButton] = [
+        button for button in buttons if button.width == page.width / 3.3
+    ]
+    phone_input: ft.TextField = find(page.views[-1], ft.TextField)[0]
+
+    def type_number() -> None:
+        phone_input.value = ""
+        for button in dial[:10]:
+            button.on_click(None)
+
+    def select_country() -> None:
+        country.on_click(None)
+        time.sleep(0.05)
+        tiles: List[ft.ListTile] = find(page.overlay[-1], ft.ListTile)
+        tiles[len(tiles) // 2].on_click(None)
+
+    return {
+        "type number": type_number,
+        "select country": select_country
+    }
+
+def run(page: ft.Page, rounds: int) -> Dict[str, float]:
+    """
+    Function to run bursts some rounds and count round trips to
+    client (frame flushes are waited for)
+
+    :params:
+        page   : Flet page (login is shown)
+        rounds : Number of rounds
+
+    :return: Action name -> mean round trips
+    """
+    results: Dict[str, float] = {}
+    for _ in range(rounds):
+        for name, action in actions(page).items():
+            batches: int = page.connection.batches
+            action()
+            time.sleep(0.05)
+            results[name] = results.get(name, 0) + (page.connection.batches - batches) / rounds
+    return results
+
+def main(rounds: int) -> None:
+    """
+    Compare marking controls on update scheduler (one flush per
+    frame or batch) with updating every control when it changes
+    (old control.update() calls), on login page bursts
+
+    :params: rounds : Rounds of every burst
+    :return: None
+    """
+    page: ft.Page = make_page()
+    FletGrm(page)
+    time.sleep(0.5)
+
+    # Scheduled updates (as handlers do)
+    scheduled: Dict[str, float] = run(page, rounds)
+    summary: Dict[str, Any] = page.scheduler.summary()
+
+    # Every marked control is updated right away
+    mark: Callable[..., Any] = page.scheduler.mark
+    page.scheduler.mark = lambda *controls: [control.update() for control in controls]
+    direct: Dict[str, float] = run(page, rounds)
+    page.scheduler.mark = mark
+
+    print(f"{rounds} rounds")
+    print(f"{"burst":<15} {"direct (trips)":>15} {"scheduled (trips)":>18}")
+    for name in scheduled:
+        print(f"{name:<15} {direct[name]:>15.1f} {scheduled[name]:>18.1f}")
+    print(
+        f"scheduler: {summary["flushes"]} flushes, "
+        f"{summary["controls_per_flush"]:.1f} controls per flush, "
+        f"{summary["mean_flush_ms"]:.2f} ms mean / {summary["max_flush_ms"]:.2f} ms max flush"
+    )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -5,15 +5,27 @@
 # Source  : https://github.com/Kourva/FletGrm
 
 # Standard Libraries
-from typing import NoReturn, Dict, Any
-import json
+from typing import NoReturn, Dict, Any, List, Callable
 
 # 3rd-party Libraries
 import flet as ft
 
 # Local Libraries
-from views import view_handler
+from views import reconcile_views, view_handler, build_view, view_stamp, is_cached, prefetch_next
 from pages.libs.menuDrawer import MenuDrawer 
+from pages.libs.viewCache import ViewCache
+from pages.libs.chatRegistry import ChatRegistry
+from pages.libs.messageStore import MessageStore
+from pages.libs.prefetcher import Prefetcher
+from pages.libs.globalSearch import GlobalSearch
+from pages.libs.messagePool import MessagePool
+from pages.libs.layoutCache import LayoutCache
+from pages.libs.updateScheduler import UpdateScheduler
+from pages.libs.outbox import Outbox
+from pages.libs.transport import LocalTransport
+from pages.libs.persistentDict import PersistentDict
+from pages.libs.assetCache import load_json
+from pages.libs.startupSnapshot import load_snapshot
 
 def FletGrm(page: ft.Page) -> NoReturn:
     """
@@ -43,13 +55,32 @@ def FletGrm(page: ft.Page) -> NoReturn:
         :params: e = Route Change Event
         :return: None
         """
-        # Clear current view and append new view (screen content)
-        page.views.clear()
-        page.views.append(
-            view_handler(page)[page.route]
-        )
+        # Turn current views into views stack of the route (screen
+        # content on top of it's parent screens), views which are
+        # already in place are kept and only new ones are sent
+        added: List[ft.View] = reconcile_views(page, page.route)
         page.update()
 
+        # Scroll the screen back to where user left it (if it's
+        # sent again)
+        if page.views[-1] in added:
+            page.view_cache.restore_scroll(page.views[-1])
+
+        # Build next likely screens while user is on this screen
+        prefetch_next(page, page.route)
+
+    def disconnect(e: ft.ControlEvent) -> NoReturn:
+        """
+        Function to handle session disconnect
+
+        :params: e = Disconnect Event
+        :return: None
+        """
+        # Stop sending outbox of this session (unsent messages are
+        # kept in store) and save pending changes of database
+        page.outbox.stop()
+        page.database.flush()
+
     def view_pop(e: ft.ViewPopEvent) -> NoReturn:
         """
         Function to pop last view in views
@@ -57,18 +88,98 @@ def FletGrm(page: ft.Page) -> NoReturn:
         :params: e = View Pop Event
         :return: None
         """
-        # Pop the last view from views
+        # Pop the last view from views (views under it are kept
+        # in place by route change)
         page.views.pop()
         top_view: ft.View = page.views[-1]
         page.go(top_view.route)
 
+    # Load parsed startup assets (self.json and countries.json)
+    # from snapshot, it's made again if any of them is changed
+    load_snapshot(
+        path="./data/startup.snapshot"
+    )
+
     # Initialize a database in page (for accessing data between
-    # various pages in Flet )
-    page.database: Dict[str, Any] = {}
-    with open("./data/self.json", "r") as file:
-        database: Dict[str, Any] = json.load(file)
-        for key, val in database.items():
-            page.database[key] = val
+    # various pages in Flet), changes are saved in background to
+    # session file and restored on next run
+    page.database: PersistentDict = PersistentDict(
+        path="./data/session.json",
+        defaults=load_json("./data/self.json")
+    )
+
+    # Initialize the message store (chats and histories are
+    # imported from json files on first run)
+    page.message_store: MessageStore = MessageStore(
+        path="./data/fletgrm.db",
+        log_directory="./data/logs"
+    )
+    page.message_store.import_json(
+        directory="./data"
+    )
+
+    # Initialize the chat registry (chats are resolved by id from
+    # routes like /chat/<id> and /profile/<id>)
+    page.chat_registry: ChatRegistry = ChatRegistry(
+        page=page
+    )
+
+    # Initialize the global search (chats by name and username,
+    # messages by text of every chat)
+    page.global_search: GlobalSearch = GlobalSearch(
+        store=page.message_store,
+        chats=page.chat_registry.chats
+    )
+
+    # Initialize the update scheduler (controls changed by
+    # handlers are sent to client together once per frame)
+    page.scheduler: UpdateScheduler = UpdateScheduler(
+        page=page,
+        interval=0.016
+    )
+
+    # Initialize the layout cache (widths which depend on page
+    # width are laid out again when page is resized)
+    page.layout_cache: LayoutCache = LayoutCache(
+        page=page,
+        bucket=8,
+        debounce=0.15
+    )
+
+    # Initialize the message pool (message controls dropped from
+    # chat histories are reused by other messages)
+    page.message_pool: MessagePool = MessagePool(
+        capacity=400
+    )
+
+    # Initialize the view cache (built views are reused between
+    # navigations until they get invalidated)
+    page.view_cache: ViewCache = ViewCache(
+        capacity=8
+    )
+
+    # Initialize the prefetcher (views of likely next routes are
+    # built in background and adopted on navigation)
+    page.prefetcher: Prefetcher = Prefetcher(
+        build=lambda route: build_view(page, route),
+        stamp=lambda route: view_stamp(page, route),
+        cached=lambda route: is_cached(page, route)
+    )
+
+    # View getter (screens which act on a view before navigating
+    # to it, e.g. search results jumping into a chat)
+    page.get_view: Callable[[str], ft.View] = lambda route: view_handler(page, route)
+
+    # Initialize the outbox (sent messages are delivered by
+    # transport in background and shown as seen when acked,
+    # there is no backend yet so a local server stands in)
+    page.outbox: Outbox = Outbox(
+        store=page.message_store,
+        transport=LocalTransport(),
+        on_ack=page.chat_registry.acknowledge,
+        batch_size=50
+    )
+    page.outbox.start(page)
 
     # Initialize the menu drawer
     page.menu_drawer: MenuDrawer = MenuDrawer(
@@ -78,6 +189,8 @@ def FletGrm(page: ft.Page) -> NoReturn:
     # Register handlers and default view
     page.on_route_change = route_change
     page.on_view_pop = view_pop
+    page.on_resized = page.layout_cache.resized
+    page.on_disconnect = disconnect
     page.go("/login")
 
 # Run the app
@@ -4,24 +4,34 @@
 # Chat page
 
 # Standard Libraries
+import time
 import random
-import json
-from typing import Any, List, Dict, NoReturn
+from typing import Any, List, Dict, Optional, NoReturn
 
 # 3rd-party Libraries
 import flet as ft
 
 # Local Libraries
 from pages.libs.pfp import ProfilePicture
-from pages.libs.message import Message
+from pages.libs.message import Message, MessageRow
+from pages.libs.messageRecord import Role, MessageRecord, HistoryBuffer
+from pages.libs.historyWindow import HistoryWindow
 
-def chat_layout(page: ft.Page) -> List[Any]:
+# Number of search results loaded at once
+SEARCH_PAGE: int = 100
+
+def chat_layout(page: ft.Page, chat_id: str) -> List[Any]:
     """
-    layout function for login page
+    layout function for chat page
+
+    :params:
+        page    : page layout
+        chat_id : Id of the chat
 
-    :params: page : page layout
     :return: list of controls
     """
+    # Resolve the chat from registry
+    db: Dict[str, Any] = page.chat_registry.resolve(chat_id)
 
     def open_profile() -> NoReturn:
         """
@@ -31,8 +41,8 @@ def chat_layout(page: ft.Page) -> List[Any]:
         :return: None
         """
         # Register last page info and open profile
-        page.database["last_page"] = "/chat"
-        page.go("/profile")
+        page.database["last_page"] = f"/chat/{chat_id}"
+        page.go(f"/profile/{chat_id}")
 
     def change_input_actions(mode: str) -> NoReturn:
         """
@@ -42,16 +52,16 @@ def chat_layout(page: ft.Page) -> List[Any]:
         :parmas: mode: "focus" or "blur"
         :return: None
         """
-        # If mode focus, show only send button and update page
+        # If mode focus, show only send button and update buttons
         if mode == "focus":
             attach_buton.width = 0
             mic_button.width = 0
             send_button.width = 40
             attach_buton.icon_color="#00000000"
             mic_button.icon_color = "#00000000"
-            page.update()
+            page.scheduler.mark(attach_buton, mic_button, send_button)
 
-        # If mode is blur, remove send button and update page
+        # If mode is blur, remove send button and update buttons
         else:
             # Keep send button if text field has value
             if not message_input.value:
@@ -60,7 +70,7 @@ def chat_layout(page: ft.Page) -> List[Any]:
                 send_button.width = 0
                 attach_buton.icon_color="#888e94"
                 mic_button.icon_color = "#888e94"
-                page.update()
+                page.scheduler.mark(attach_buton, mic_button, send_button)
 
     def send_message() -> NoReturn:
         """
@@ -71,35 +81,188 @@ def chat_layout(page: ft.Page) -> List[Any]:
         """
         # If text field in not empty
         if (msg:=message_input.value):
-            # Insert message to first index of scroll view
-            # because scroll view is reversed
-            chat_history.controls.insert(
-                0,
-                Message(
-                    message=msg.strip(),
-                    time="00:00 AM",
-                    role="self",
-                    seen=False,
-                    page=page
-                ).build()
+            # Save message to chat history (a date separator is
+            # added if it's first message of the day)
+            now: time.struct_time = time.localtime()
+            message: Dict[str, Any] = {
+                "role": "self",
+                "message": msg.strip(),
+                "time": time.strftime("%I:%M %p", now).lstrip("0"),
+                "seen": False,
+                "date": f"{time.strftime("%B", now)} {now.tm_mday}"
+            }
+            sent: HistoryBuffer = page.message_store.receive(
+                chat_id=chat_id,
+                messages=[message]
+            )
+
+            # Add message under chat history window (first index
+            # of scroll view because scroll view is reversed)
+            history.append(sent)
+
+            # Queue message in outbox, it's shown as seen when
+            # server acks it
+            page.outbox.put(
+                chat_id=chat_id,
+                seq=sent.start + len(sent) - 1,
+                message=message
             )
-            # Clear text input and scroll to bottom of scroll view
+
+            # Clear text input
             message_input.value = ""
+
+            # Update only new message, text input and greeting (sent
+            # before scrolling and reusing dropped controls)
+            with page.scheduler.batch():
+                page.scheduler.mark(chat_history, message_input)
+                hide_greeting()
+
+            # Scroll to bottom of scroll view and reuse controls
+            # dropped from window
             chat_history.scroll_to(
                 offset=0,
                 duration=500, 
                 curve=ft.AnimationCurve.EASE_IN_OUT_CUBIC
             )
-            # Remove greeting message if it's on page
-            try:
-                # Find the greeting message and pop it from page
-                target = chat_controls.index(welcome_message)
-                chat_controls.pop(target)
-                chat_history.expand = True
-            except (NameError, ValueError):
-                pass
-        # Update the page
-        page.update()
+            history.recycle()
+
+            # Cached menu shows the last message of chats, drop it
+            page.view_cache.invalidate(
+                route="/menu"
+            )
+
+    def hide_greeting() -> NoReturn:
+        """
+        Helper function to hide greeting message when first
+        messages are added to chat history
+
+        :params: None
+        :return: None
+        """
+        if welcome_message is not None and welcome_message.visible:
+            welcome_message.visible = False
+            chat_history.expand = True
+            page.scheduler.mark(chat_history, welcome_message)
+
+    def message_controls(message: MessageRecord) -> List[ft.Control]:
+        """
+        Helper function to render a message of chat history
+
+        :params: message : Message
+        :return: Controls of message (in order of reversed scroll view)
+        """
+        # Add time info if role is system
+        if message.role is Role.SYSTEM:
+            return [
+                ft.Text(
+                    value="", 
+                    height=5
+                ),
+                MessageRow(
+                    height=34,
+                    spacing=0,
+                    alignment=ft.MainAxisAlignment.CENTER,
+                    controls=[
+                        ft.Container(
+                            alignment=ft.alignment.Alignment(0, 0),
+                            content=ft.TextButton(
+                                content=ft.Text(
+                                    value=message.time, 
+                                    size=15
+                                ),
+                                style=ft.ButtonStyle(
+                                    bgcolor="#09ffffff"
+                                )
+                            )
+                        )
+                    ]
+                ),
+                ft.Text(
+                    value="", 
+                    height=5
+                )
+            ]
+        # Otherwise if role is "self" or "partner", add message
+        return [
+            page.message_pool.acquire(
+                Message(
+                    message=message.message,
+                    time=message.time,
+                    role=message.role.label,
+                    seen=message.seen,
+                    page=page,
+                    key=str(message.seq)
+                )
+            )
+        ]
+
+    def toggle_search(visible: bool) -> NoReturn:
+        """
+        Helper function to show or hide search bar
+
+        :params: visible : Show search bar
+        :return: None
+        """
+        search_bar.visible = visible
+        search_input.value = ""
+        search_counter.value = ""
+        search_results.clear()
+        with page.scheduler.batch():
+            page.scheduler.mark(search_bar)
+        if visible:
+            search_input.focus()
+
+    def search_changed() -> NoReturn:
+        """
+        Helper function to search chat history when query changes
+
+        :params: None
+        :return: None
+        """
+        nonlocal search_more
+        search_results[:] = page.message_store.search(
+            chat_id=chat_id,
+            query=search_input.value,
+            limit=SEARCH_PAGE
+        )
+        search_more = len(search_results) == SEARCH_PAGE
+        show_result(0)
+
+    def show_result(position: int) -> NoReturn:
+        """
+        Helper function to jump to a search result
+
+        :params: position : Position in results (0 is newest)
+        :return: None
+        """
+        nonlocal search_position, search_more
+        if not search_results:
+            search_counter.value = "No results" if search_input.value.strip() else ""
+            page.scheduler.mark(search_counter)
+            return None
+
+        # Load next page of older results when last one is passed
+        if position >= len(search_results) and search_more:
+            limit: int = len(search_results) + SEARCH_PAGE
+            search_results[:] = page.message_store.search(
+                chat_id=chat_id,
+                query=search_input.value,
+                limit=limit
+            )
+            search_more = len(search_results) == limit
+
+        # Results are cycled with up (older) and down (newer)
+        position %= len(search_results)
+        search_position = position
+        search_counter.value = f"{position + 1} of {len(search_results)}{"+" if search_more else ""}"
+        page.scheduler.mark(search_counter)
+        history.show(search_results[position])
+
+    # Search results (seqs, newest first), selected result and if
+    # there may be more (older) results
+    search_results: List[int] = []
+    search_position: int = 0
+    search_more: bool = False
 
     chat_controls: List[Any] = [
         # App bar
@@ -122,21 +285,21 @@ def chat_layout(page: ft.Page) -> List[Any]:
                     spacing=10,
                     controls=[
                         ProfilePicture(
-                            profile=page.database["chat"]["profile"],
-                            has_story=page.database["chat"]["has_story"],
+                            profile=db["profile"],
+                            has_story=db["has_story"],
                             size=40
                         ).build(),
                         ft.Column(
                             spacing=0,
                             controls=[
                                 ft.Text(
-                                    value=page.database["chat"]["name"], 
+                                    value=db["name"], 
                                     size=19, 
                                     color="#ffffff", 
                                     weight="bold"
                                 ),
                                 ft.Text(
-                                    value=page.database["chat"]["status"], 
+                                    value=db["status"], 
                                     size=16,
                                     color="#888e94"
                                 )
@@ -161,7 +324,10 @@ def chat_layout(page: ft.Page) -> List[Any]:
                         ),
                         ft.PopupMenuItem(
                             icon="search",
-                            text="Search"
+                            text="Search",
+                            on_click=lambda _: toggle_search(
+                                visible=True
+                            )
                         ),
                         ft.PopupMenuItem(
                             icon="video_call",
@@ -187,6 +353,50 @@ def chat_layout(page: ft.Page) -> List[Any]:
                 )
             ]
         ),
+        # Search bar
+        search_bar := ft.Container(
+            visible=False,
+            bgcolor="#243140",
+            padding=ft.padding.only(left=5, right=5),
+            content=ft.Row(
+                spacing=0,
+                controls=[
+                    ft.IconButton(
+                        icon="close",
+                        icon_color="#888e94",
+                        on_click=lambda _: toggle_search(
+                            visible=False
+                        )
+                    ),
+                    search_input := ft.TextField(
+                        expand=True,
+                        text_size=18,
+                        hint_text="Search",
+                        border=ft.InputBorder.NONE,
+                        on_change=lambda _: search_changed()
+                    ),
+                    search_counter := ft.Text(
+                        value="",
+                        color="#888e94"
+                    ),
+                    ft.IconButton(
+                        icon="keyboard_arrow_up",
+                        icon_color="#888e94",
+                        on_click=lambda _: show_result(
+                            search_position + 1
+                        )
+                    ),
+                    ft.IconButton(
+                        icon="keyboard_arrow_down",
+                        icon_color="#888e94",
+                        on_click=lambda _: show_result(
+                            search_position - 1
+                        )
+                    )
+                ]
+            )
+        ),
+
         # Chat history
         chat_history := ft.ListView(
             expand=True,
@@ -194,6 +404,8 @@ def chat_layout(page: ft.Page) -> List[Any]:
             padding=10,
             spacing=5,
             reverse=True,
+            on_scroll_interval=100,
+            on_scroll=lambda event: history.scrolled(event),
             controls=[]
         ),
 
@@ -258,76 +470,22 @@ def chat_layout(page: ft.Page) -> List[Any]:
         )
     ]
     
-    # Initialize the database
-    db: Dict[str, Any] = page.database["chat"]
-
-    # Load chat history from database
-    try:
-        with open(
-            file=f"./data/messages/{db["id"]}.json", 
-            mode="r"
-        ) as file:
-            messages: Dict[str, Any] = json.load(file)
-
-    except FileNotFoundError:
-        messages: Dict[str, Any] = {}
-
-    # Add messages to chat history
-    if messages:
-        for message in messages:
-            # Add time info if role is system
-            if message["role"] == "system":
-                chat_history.controls.insert(
-                    0, 
-                    ft.Text(
-                        value="", 
-                        height=5
-                    )
-                )
-                chat_history.controls.insert(
-                    0,
-                    ft.Row(
-                        height=34,
-                        spacing=0,
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        controls=[
-                            ft.Container(
-                                alignment=ft.alignment.Alignment(0, 0),
-                                content=ft.TextButton(
-                                    content=ft.Text(
-                                        value=message["time"], 
-                                        size=15
-                                    ),
-                                    style=ft.ButtonStyle(
-                                        bgcolor="#09ffffff"
-                                    )
-                                )
-                            )
-                        ]
-                    )
-                )
-                chat_history.controls.insert(
-                    0, 
-                    ft.Text(
-                        value="", 
-                        height=5
-                    )
-                )
-            # Otherwise if role is "self" or "partner", add message
-            else:
-                chat_history.controls.insert(
-                    0,
-                    Message(
-                        message=message["message"],
-                        time=message["time"],
-                        role=message["role"],
-                        seen=message["seen"],
-                        page=page
-                    ).build()
-                )
+    # Show a window of latest messages, older ones are loaded
+    # as user scrolls up (list view holds it for search page and
+    # received messages)
+    history: HistoryWindow = HistoryWindow(
+        store=page.message_store,
+        chat_id=chat_id,
+        list_view=chat_history,
+        render=message_controls,
+        release=page.message_pool.release,
+        on_extend=hide_greeting
+    )
+    chat_history.data = history
 
     # Add greeting message if there is no history
-    else:
+    welcome_message: Optional[ft.Container] = None
+    if not history.load_latest():
         # Hide the scroll view and add greetings
         chat_history.expand = False
         chat_controls.insert(
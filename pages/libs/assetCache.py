@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import os
+import json
+import threading
+from typing import NoReturn, Self, Dict, Tuple, Any
+
+class AssetCache:
+    """
+    Process-wide cache of parsed JSON assets, every file is parsed
+    once and read again only when it's mtime or size changes
+
+    Note: parsed data is shared between pages and sessions, don't
+    mutate it (copy it first)
+    """
+    def __init__(self: Self) -> NoReturn:
+        self.lock: threading.Lock = threading.Lock()
+        self.entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0
+        }
+
+    @staticmethod
+    def signature(path: str) -> Tuple[int, int]:
+        """
+        Static method to return state of a file on disk
+
+        :params: path : File path
+        :return: mtime (ns) and size of file
+        """
+        stat: os.stat_result = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self: Self, path: str) -> Any:
+        """
+        Method to return parsed data of a JSON file
+
+        :params: path : File path
+        :return: Parsed data (shared, read only)
+        """
+        path = os.path.abspath(path)
+        signature: Tuple[int, int] = self.signature(path)
+        with self.lock:
+            entry: Tuple[Tuple[int, int], Any] = self.entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+
+        # Parse outside the lock, other assets are not blocked
+        with open(path, "r", encoding="utf-8") as file:
+            data: Any = json.load(file)
+        with self.lock:
+            self.entries[path] = (signature, data)
+        return data
+
+    def prime(self: Self,
+              path: str,
+              signature: Tuple[int, int],
+              data: Any) -> NoReturn:
+        """
+        Method to add data of a file which is parsed elsewhere (like
+        startup snapshot)
+
+        :params:
+            path      : File path
+            signature : State of file the data is parsed from
+            data      : Parsed data
+
+        :return: None
+        """
+        with self.lock:
+            self.entries[os.path.abspath(path)] = (signature, data)
+
+    def clear(self: Self) -> NoReturn:
+        """
+        Method to drop all parsed assets
+
+        :params: Self
+        :return: None
+        """
+        with self.lock:
+            self.entries.clear()
+
+# Cache shared by every page and session
+assets: AssetCache = AssetCache()
+
+def load_json(path: str) -> Any:
+    """
+    Function to load a JSON asset from shared cache
+
+    :params: path : File path
+    :return: Parsed data (shared, read only)
+    """
+    return assets.load(path)
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 # Standard Libraries
-from typing import Self, Union, NoReturn, Dict
+from typing import Self, Union, NoReturn
 
 # 3rd-party Libraries
 import flet as ft
@@ -24,13 +24,7 @@ class ChatDialog:
                  pinned: bool,
                  muted: bool,
                  chat_id: str,
-                 phone_number: str,
-                 username: str,
-                 birth: str,
-                 status: str,
-                 bio: str,
                  has_story: bool,
-                 channel: Union[None, Dict[str, str]],
                  story_seen: bool,
                  page: ft.Page) -> NoReturn:
         
@@ -43,37 +37,19 @@ class ChatDialog:
         self.pinned: bool = pinned
         self.muted: bool = muted
         self.chat_id: str = chat_id
-        self.phone_number: str = phone_number
-        self.username: str = username
-        self.birth: str = birth
-        self.status: str = status
-        self.bio: str = bio
         self.has_story: bool = has_story 
-        self.channel: Union[None, Dict[str, str]] = channel
         self.story_seen: bool = story_seen
         self.page: ft.Page = page
 
     def click_function(self: Self) -> NoReturn:
         """
-        Helper method to register database information
-        and go to chat page
+        Helper method to go to chat page (chat is resolved
+        by it's id from chat registry)
 
         :params: Self
         :return: None
         """
-        db: Dict[str, Any] = self.page.database["chat"]
-        db["id"] = self.chat_id
-        db["profile"] = self.profile
-        db["name"] = self.name
-        db["phone_number"] = self.phone_number
-        db["username"] = self.username
-        db["birth"] = self.birth
-        db["status"] = self.status
-        db["bio"] = self.bio
-        db["has_story"] = self.has_story
-        db["channel"] = self.channel
-        db["story_seen"] = self.story_seen
-        self.page.go("/chat")
+        self.page.go(f"/chat/{self.chat_id}")
 
     def build(self: Self) -> ft.ListTile:
         """
@@ -134,13 +110,12 @@ class ChatDialog:
             subtitle=ft.Row(
                 spacing=5,
                 controls=[
-                    ft.Text(
+                    self.page.layout_cache.fit(ft.Text(
                         value=self.message,
                         color="#888e94",
-                        width=self.page.width / 1.9,
                         no_wrap=True,
                         overflow=ft.TextOverflow.ELLIPSIS
-                    ),
+                    ), 1.9),
                     ft.Row(
                         width=50,
                         alignment=ft.MainAxisAlignment.END,
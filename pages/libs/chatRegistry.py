@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+from typing import NoReturn, Self, Optional, Iterable, Tuple, Dict, List, Any
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from pages.libs.message import Message
+from pages.libs.messageRecord import HistoryBuffer
+
+class ChatRegistry:
+    """
+    Registry of chat entities (chats and user's own profile)
+    resolved by id from routes like /chat/<id> and /profile/<id>
+    """
+    def __init__(self: Self, page: ft.Page) -> NoReturn:
+        self.page: ft.Page = page
+        self.entities: Dict[str, Dict[str, Any]] = {}
+
+        # Load chats from message store
+        self.chats: List[Dict[str, Any]] = page.message_store.chats()
+        for chat in self.chats:
+            self.entities[chat["id"]] = chat
+
+        # Register user's own profile
+        db: Dict[str, Any] = page.database
+        self.entities[db["id"]] = {
+            "id": db["id"],
+            "profile": db["profile"],
+            "name": db["name"],
+            "phone_number": db["phone_number"],
+            "username": db["username"],
+            "birth": db["birth"],
+            "status": db["status"],
+            "bio": db["bio"],
+            "has_story": db["has_story"],
+            "channel": db["channel"],
+            "story_seen": False
+        }
+
+    def resolve(self: Self, chat_id: str) -> Dict[str, Any]:
+        """
+        Method to return chat entity by it's id
+
+        :params: chat_id : Chat Id
+        :return: Chat entity
+        """
+        return self.entities[chat_id]
+
+    def deliver(self: Self,
+                chat_id: str,
+                messages: Iterable[Dict[str, Any]]) -> HistoryBuffer:
+        """
+        Method to deliver a burst of incoming messages to a chat
+        (format of data/messages/*.json with "date" of every
+        message), they are stored in one append and shown by chat
+        view if it's built
+
+        :params:
+            chat_id  : Chat Id
+            messages : Incoming messages (oldest first)
+
+        :return: History buffer of stored messages
+        """
+        buffer: HistoryBuffer = self.page.message_store.receive(
+            chat_id=chat_id,
+            messages=messages
+        )
+
+        # Show messages in chat view (list view holds it's history)
+        view: Optional[ft.View] = self.page.view_cache.get("/chat/:chat_id", chat_id)
+        if view is not None:
+            for control in view.controls:
+                if isinstance(control, ft.ListView):
+                    control.data.receive(buffer)
+
+        # Cached menu shows the last message of chats, drop it
+        self.page.view_cache.invalidate(
+            route="/menu"
+        )
+        return buffer
+
+    def acknowledge(self: Self, keys: Iterable[Tuple[str, int]]) -> NoReturn:
+        """
+        Method to show acked messages as seen in chat views which
+        are built (they are marked on update scheduler, so acks of
+        a frame are sent together)
+
+        :params: keys : Chat Id and seq of acked messages
+        :return: None
+        """
+        chats: Dict[str, List[int]] = {}
+        for chat_id, seq in keys:
+            chats.setdefault(chat_id, []).append(seq)
+
+        for chat_id, seqs in chats.items():
+            view: Optional[ft.View] = self.page.view_cache.get("/chat/:chat_id", chat_id)
+            if view is None:
+                continue
+            for control in view.controls:
+                if isinstance(control, ft.ListView):
+                    self.page.scheduler.mark(*(
+                        Message.mark_seen(row) for row in control.data.find(seqs)
+                    ))
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NoReturn, Self, Optional, Callable, List, Dict, Set, Any
+
+# Local Libraries
+from pages.libs.searchIndex import ChatIndex, tokenize
+from pages.libs.messageStore import MessageStore
+
+class GlobalSearch:
+    """
+    Search over chats (names and usernames) and message text of
+    every chat, queries run on a background thread and results are
+    sent in parts as they are found, a new query cancels old ones
+    """
+    def __init__(self: Self,
+                 store: MessageStore,
+                 chats: List[Dict[str, Any]],
+                 chat_limit: Optional[int] = 20,
+                 message_limit: Optional[int] = 100,
+                 interval: Optional[float] = 0.05) -> NoReturn:
+
+        self.store: MessageStore = store
+        self.chats: List[Dict[str, Any]] = chats
+        self.chat_index: ChatIndex = ChatIndex(chats)
+        self.chat_limit: int = chat_limit
+        self.message_limit: int = message_limit
+        self.interval: float = interval
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="search"
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.generation: int = 0
+        self.warmed: bool = False
+
+    def warm(self: Self) -> NoReturn:
+        """
+        Method to build message indexes of all chats in background
+        (it runs once, before first query)
+
+        :params: Self
+        :return: None
+        """
+        if self.warmed:
+            return None
+        self.warmed = True
+
+        def build() -> NoReturn:
+            for chat in self.chats:
+                self.store.message_index(chat["id"])
+
+        threading.Thread(target=build, name="search-warm", daemon=True).start()
+
+    def stale(self: Self, generation: int) -> bool:
+        """
+        Method to check if a query is replaced by a newer one
+
+        :params: generation : Generation of query
+        :return: True if query is stale
+        """
+        return generation != self.generation
+
+    def search(self: Self,
+               query: str,
+               on_results: Callable[[Dict[str, Any]], None]) -> int:
+        """
+        Method to start a query, older queries are cancelled
+
+        :params:
+            query      : Search query
+            on_results : Called with results as they are found,
+                         {"generation", "query", "chats",
+                         "messages", "done"}
+
+        :return: Generation of query
+        """
+        with self.lock:
+            self.generation += 1
+            generation: int = self.generation
+        self.executor.submit(self.run, query, generation, on_results)
+        return generation
+
+    def run(self: Self,
+            query: str,
+            generation: int,
+            on_results: Callable[[Dict[str, Any]], None]) -> NoReturn:
+        """
+        Method to run a query (on search thread), chats are sent
+        first and messages are sent in parts, chats are searched in
+        list order (newest first) and messages newest first
+
+        :params:
+            query      : Search query
+            generation : Generation of query
+            on_results : Results callback
+
+        :return: None
+        """
+        if self.stale(generation):
+            return None
+        results: Dict[str, Any] = {
+            "generation": generation,
+            "query": query,
+            "chats": self.chat_index.search(query, self.chat_limit),
+            "messages": [],
+            "done": not query.strip()
+        }
+        on_results(results)
+        if results["done"]:
+            return None
+
+        # Indexed chats which can't match are skipped (their terms
+        # are in vocabulary), others are indexed while searching
+        tokens: List[str] = tokenize(query)
+        with self.store.index_lock:
+            indexed: Set[str] = set(self.store.indexes)
+            candidates: Optional[Set[str]] = self.store.vocabulary.find(tokens)
+
+        # Search messages chat by chat, send found ones after every
+        # interval and stop on a newer query or enough results
+        sent: float = time.perf_counter()
+        found: List[Dict[str, Any]] = []
+        for chat in self.chats:
+            if (
+                candidates is not None
+                and chat["id"] in indexed
+                and chat["id"] not in candidates
+            ):
+                continue
+            if self.stale(generation):
+                return None
+            limit: int = self.message_limit - len(results["messages"]) - len(found)
+            for seq in self.store.message_index(chat["id"]).find(tokens, limit):
+                found.append({"chat": chat, "seq": seq})
+            if len(results["messages"]) + len(found) >= self.message_limit:
+                break
+            if found and time.perf_counter() - sent >= self.interval:
+                if self.stale(generation):
+                    return None
+                results = results | {"messages": results["messages"] + found}
+                found = []
+                on_results(results)
+                sent = time.perf_counter()
+
+        if not self.stale(generation):
+            on_results(results | {
+                "messages": results["messages"] + found,
+                "done": True
+            })
@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import threading
+from collections import deque
+from typing import NoReturn, Self, Optional, Callable, Iterable, Sequence, Deque, Tuple, List, Set
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from pages.libs.messageStore import MessageStore
+from pages.libs.messageRecord import MessageRecord, HistoryBuffer
+
+class HistoryWindow:
+    """
+    Window of chat history in a reversed ListView (newest control
+    first), only a window of messages has controls: older pages are
+    loaded as user scrolls up, newer ones as user scrolls down and
+    messages out of window are dropped, so open time and memory
+    don't depend on history length
+    """
+    def __init__(self: Self,
+                 store: MessageStore,
+                 chat_id: str,
+                 list_view: ft.ListView,
+                 render: Callable[[MessageRecord], List[ft.Control]],
+                 release: Optional[Callable[[List[ft.Control]], None]] = None,
+                 on_extend: Optional[Callable[[], None]] = None,
+                 page_size: Optional[int] = 50,
+                 window_size: Optional[int] = 200,
+                 threshold: Optional[float] = 600,
+                 anchor: Optional[float] = 50) -> NoReturn:
+
+        self.store: MessageStore = store
+        self.chat_id: str = chat_id
+        self.list_view: ft.ListView = list_view
+        self.render: Callable[[MessageRecord], List[ft.Control]] = render
+        self.release: Optional[Callable[[List[ft.Control]], None]] = release
+        self.on_extend: Optional[Callable[[], None]] = on_extend
+        self.page_size: int = page_size
+        self.window_size: int = window_size
+        self.threshold: float = threshold
+        self.anchor: float = anchor
+        self.lock: threading.Lock = threading.Lock()
+
+        # Seqs of window [start, stop) and number of controls of
+        # every message in window (newest first, like controls)
+        self.start: int = 0
+        self.stop: int = 0
+        self.sizes: Deque[int] = deque()
+
+        # Distance of view from newest message (pixels), received
+        # messages are shown only if user is at the newest one
+        self.offset: float = 0
+
+        # Controls dropped out of window, they are released (to
+        # be reused) after the update which removes them from page
+        self.dropped: List[ft.Control] = []
+
+        # Message to scroll to when list view is shown (jumps asked
+        # before view is on page)
+        self.pending: Optional[int] = None
+        self.list_view.did_mount = self.mounted
+
+    def controls(self: Self,
+                 messages: Sequence[MessageRecord]) -> Tuple[List[ft.Control], List[int]]:
+        """
+        Method to render messages (oldest first) into controls in
+        list view order (newest first), it's a single pass over
+        messages from newest and controls are only appended
+
+        :params: messages : Messages to render
+        :return: Controls and number of controls of every message
+                 (newest first)
+        """
+        controls: List[ft.Control] = []
+        sizes: List[int] = []
+        for message in reversed(messages):
+            rendered: List[ft.Control] = self.render(message)
+            controls += rendered
+            sizes.append(len(rendered))
+        return controls, sizes
+
+    def load(self: Self, stop: int) -> int:
+        """
+        Method to replace window with a page of messages ending
+        before stop
+
+        :params: stop : Window ends before this seq
+        :return: Number of messages in window
+        """
+        buffer: HistoryBuffer = self.store.messages_before(
+            chat_id=self.chat_id,
+            seq=stop,
+            limit=self.page_size
+        )
+        controls, sizes = self.controls(buffer)
+        self.dropped += self.list_view.controls
+        self.list_view.controls[:] = controls
+        self.sizes = deque(sizes)
+        self.start = buffer.start
+        self.stop = buffer.start + len(buffer)
+        return len(buffer)
+
+    def load_latest(self: Self) -> int:
+        """
+        Method to load latest page of history (used on open)
+
+        :params: Self
+        :return: Number of messages in window
+        """
+        return self.load(self.store.count(self.chat_id))
+
+    def add_older(self: Self, messages: HistoryBuffer) -> NoReturn:
+        """
+        Method to add messages on top of window and drop newest
+        messages out of window
+
+        :params: messages : Messages before window (oldest first)
+        :return: None
+        """
+        controls, sizes = self.controls(messages)
+        self.list_view.controls.extend(controls)
+        self.sizes.extend(sizes)
+        self.start = messages.start
+        while len(self.sizes) > self.window_size:
+            size: int = self.sizes.popleft()
+            self.dropped += self.list_view.controls[:size]
+            del self.list_view.controls[:size]
+            self.stop -= 1
+
+    def add_newer(self: Self, messages: Sequence[MessageRecord], stop: int) -> NoReturn:
+        """
+        Method to add messages under window and drop oldest
+        messages out of window
+
+        :params:
+            messages : Messages after window (oldest first)
+            stop     : Window ends before this seq
+
+        :return: None
+        """
+        controls, sizes = self.controls(messages)
+        self.list_view.controls[:0] = controls
+        self.sizes.extendleft(reversed(sizes))
+        self.stop = stop
+        while len(self.sizes) > self.window_size:
+            size: int = self.sizes.pop()
+            self.dropped += self.list_view.controls[-size:]
+            del self.list_view.controls[-size:]
+            self.start += 1
+
+    def scrolled(self: Self, event: ft.OnScrollEvent) -> bool:
+        """
+        Method to page history when list view is scrolled near
+        its top (older) or bottom (newer) end, events which come
+        while a page is loading are skipped
+
+        :params: event : Scroll event of list view
+        :return: True if window is changed
+        """
+        self.offset = event.pixels - event.min_scroll_extent
+        if not self.lock.acquire(blocking=False):
+            return False
+        try:
+            # Message at bottom of view, adding or dropping controls
+            # under it moves it so view is scrolled back to it
+            anchor: Optional[str] = self.anchor_key(event)
+            # List view is reversed, offset 0 is the newest message
+            if event.max_scroll_extent - event.pixels < self.threshold and self.start:
+                self.add_older(self.store.messages_before(
+                    chat_id=self.chat_id,
+                    seq=self.start,
+                    limit=self.page_size
+                ))
+            elif event.pixels - event.min_scroll_extent < self.threshold and (
+                self.stop < (total := self.store.count(self.chat_id))
+            ):
+                stop: int = min(self.stop + self.page_size, total)
+                self.add_newer(self.store.messages_before(
+                    chat_id=self.chat_id,
+                    seq=stop,
+                    limit=stop - self.stop
+                ), stop)
+            else:
+                return False
+            if anchor is not None and not self.start <= int(anchor) < self.stop:
+                anchor = None
+        finally:
+            self.lock.release()
+        self.list_view.update()
+        if anchor is not None:
+            self.list_view.scroll_to(key=anchor, duration=0)
+        self.recycle()
+        return True
+
+    def anchor_key(self: Self, event: ft.OnScrollEvent) -> Optional[str]:
+        """
+        Method to return key of message at bottom of view (list
+        view is reversed), it's found by mean height of controls
+        because their heights are only known by client
+
+        :params: event : Scroll event of list view
+        :return: Key of message or None if window has no message
+        """
+        controls: List[ft.Control] = self.list_view.controls
+        extent: float = (
+            event.max_scroll_extent - event.min_scroll_extent
+            + (event.viewport_dimension or 0)
+        )
+        if not controls or extent <= 0:
+            return None
+
+        # Closest message (date separators have no key) from there
+        # towards older ones
+        position: int = min(int(self.offset / extent * len(controls)), len(controls) - 1)
+        for control in controls[position:]:
+            if control.key is not None:
+                return control.key
+        return None
+
+    def append(self: Self, messages: HistoryBuffer) -> NoReturn:
+        """
+        Method to add sent messages under window, window is moved
+        to latest page if it doesn't end with previous message
+
+        :params: messages : Sent messages (oldest first)
+        :return: None
+        """
+        with self.lock:
+            stop: int = messages.start + len(messages)
+            if self.stop == messages.start:
+                self.add_newer(messages, stop)
+            else:
+                self.load(stop)
+
+    def find(self: Self, seqs: Iterable[int]) -> List[ft.Control]:
+        """
+        Method to return controls of messages which are in window
+
+        :params: seqs : Seqs of messages
+        :return: Controls of messages (by their key)
+        """
+        keys: Set[str] = {str(seq) for seq in seqs}
+        with self.lock:
+            return [
+                control for control in self.list_view.controls
+                if control.key in keys
+            ]
+
+    def extend(self: Self, messages: HistoryBuffer) -> bool:
+        """
+        Method to add received messages under window if user is at
+        newest message (bursts longer than a page replace window
+        with latest page, older ones are loaded on scroll), otherwise window is kept where user is and
+        messages are loaded as user scrolls down
+
+        :params: messages : Received messages (oldest first)
+        :return: True if window is changed
+        """
+        if self.offset > self.anchor or self.stop != messages.start:
+            return False
+        stop: int = messages.start + len(messages)
+        if len(messages) <= self.page_size:
+            self.add_newer(messages, stop)
+        else:
+            self.load(stop)
+        return True
+
+    def receive(self: Self, messages: HistoryBuffer) -> NoReturn:
+        """
+        Method to show a burst of received messages, list view is
+        changed once and sent in one flush of update scheduler
+
+        :params: messages : Received messages (oldest first)
+        :return: None
+        """
+        with self.lock:
+            changed: bool = self.extend(messages)
+        if not changed:
+            return None
+
+        # Window of a cached view is sent with the view
+        if (page := self.list_view.page) is not None:
+            with page.scheduler.batch():
+                page.scheduler.mark(self.list_view)
+                if self.on_extend:
+                    self.on_extend()
+        elif self.on_extend:
+            self.on_extend()
+        self.recycle()
+
+    def show(self: Self, seq: int, duration: Optional[int] = 300) -> NoReturn:
+        """
+        Method to scroll to a message, window is moved around it
+        if it's out of window
+
+        :params:
+            seq      : Seq of message
+            duration : Scroll animation duration
+
+        :return: None
+        """
+        with self.lock:
+            if not self.start <= seq < self.stop:
+                self.load(min(
+                    seq + self.page_size // 2 + 1,
+                    self.store.count(self.chat_id)
+                ))
+
+        # Window is sent with the view if it's not on page yet
+        if self.list_view.page is None:
+            self.pending = seq
+            self.recycle()
+            return None
+        self.list_view.update()
+        self.recycle()
+        self.list_view.scroll_to(key=str(seq), duration=duration)
+
+    def mounted(self: Self) -> NoReturn:
+        """
+        Method to scroll to pending message when list view is added
+        to page (saved scroll offset of view is dropped)
+
+        :params: Self
+        :return: None
+        """
+        if self.pending is None:
+            return None
+        seq, self.pending = self.pending, None
+        self.list_view.page.view_cache.forget_scroll(self.list_view)
+        self.list_view.scroll_to(key=str(seq), duration=300)
+
+    def recycle(self: Self) -> NoReturn:
+        """
+        Method to release dropped controls, call it after the
+        update which removed them from page
+
+        :params: Self
+        :return: None
+        """
+        with self.lock:
+            dropped: List[ft.Control] = self.dropped
+            self.dropped = []
+        if self.release is not None and dropped:
+            self.release(dropped)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import os
+import json
+from itertools import islice
+from typing import Iterator, Optional, List, Any
+
+def iter_array(path: str, chunk_size: Optional[int] = 65536) -> Iterator[Any]:
+    """
+    Generator to read items of a JSON array file one by one (only
+    one chunk and current item are kept in memory)
+
+    :params:
+        path       : Path of JSON array file
+        chunk_size : Number of characters to read at once
+
+    :return: Iterator of array items (first to last)
+    """
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as file:
+        buffer: str = file.read(chunk_size).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{path} is not a JSON array")
+        buffer = buffer[1:]
+        eof: bool = False
+
+        while True:
+            # Skip separators between items
+            buffer = buffer.lstrip()
+            if buffer.startswith(","):
+                buffer = buffer[1:].lstrip()
+            if buffer.startswith("]"):
+                return None
+
+            # Decode next item, read more if it's incomplete
+            try:
+                item, end = decoder.raw_decode(buffer)
+                if end < len(buffer) or eof:
+                    buffer = buffer[end:]
+                    yield item
+                    continue
+            except ValueError:
+                if eof:
+                    raise
+            chunk: str = file.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+
+def iter_array_reversed(path: str, chunk_size: Optional[int] = 65536) -> Iterator[Any]:
+    """
+    Generator to read object items of a JSON array file from the
+    end (chunks are read backwards, so last items are available
+    without reading the whole file)
+
+    :params:
+        path       : Path of JSON array file
+        chunk_size : Number of bytes to read at once
+
+    :return: Iterator of array items (last to first)
+    """
+    with open(path, "rb") as file:
+        position: int = file.seek(0, os.SEEK_END)
+        buffer: bytes = b""
+
+        while True:
+            # Drop array end and separators after current item
+            buffer = buffer.rstrip().rstrip(b"]").rstrip().rstrip(b",").rstrip()
+            if position == 0 and buffer in (b"[", b""):
+                return None
+
+            # Find start of last item (a "{" after "," or "[" which
+            # decodes until end of buffer)
+            search: int = len(buffer)
+            while (start := buffer.rfind(b"{", 0, search)) != -1:
+                search = start
+                if buffer[:start].rstrip()[-1:] not in (b",", b"["):
+                    continue
+                try:
+                    item: Any = json.loads(buffer[start:])
+                except ValueError:
+                    continue
+                buffer = buffer[:start]
+                yield item
+                break
+
+            # Read previous chunk if item starts before buffer
+            else:
+                if position == 0:
+                    raise ValueError(f"{path} is not a JSON array of objects")
+                size: int = min(chunk_size, position)
+                position -= size
+                file.seek(position)
+                buffer = file.read(size) + buffer
+
+def tail_array(path: str, count: int) -> List[Any]:
+    """
+    Function to read last items of a JSON array file
+
+    :params:
+        path  : Path of JSON array file
+        count : Number of items
+
+    :return: List of items (first to last)
+    """
+    return list(islice(iter_array_reversed(path), count))[::-1]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import threading
+from weakref import WeakKeyDictionary
+from typing import NoReturn, Self, Optional, TypeVar, Tuple, List, Dict, Any
+
+# 3rd-party Libraries
+import flet as ft
+
+# Control type (fit() returns the control it's given)
+ControlT = TypeVar("ControlT", bound=ft.Control)
+
+class LayoutCache:
+    """
+    Cache of widths which depend on page width (e.g. long message
+    bubbles and chat dialog texts), page width is rounded down to
+    a bucket so widths are computed once per bucket, and controls
+    are laid out again when a resize (debounced) changes bucket
+    """
+    def __init__(self: Self,
+                 page: ft.Page,
+                 bucket: Optional[int] = 8,
+                 debounce: Optional[float] = 0.15) -> NoReturn:
+
+        self.page: ft.Page = page
+        self.bucket_size: int = bucket
+        self.debounce: float = debounce
+        self.lock: threading.Lock = threading.Lock()
+        self.timer: Optional[threading.Timer] = None
+        self.bucket: int = self.to_bucket(page.width)
+        self.widths: Dict[Tuple[int, float], float] = {}
+
+        # Controls with a page width dependent width (control ->
+        # ratio of page width), dropped controls are forgotten
+        self.controls: WeakKeyDictionary[ft.Control, float] = WeakKeyDictionary()
+        self.stats: Dict[str, float] = {
+            "resizes": 0,
+            "layouts": 0,
+            "controls": 0
+        }
+
+    def to_bucket(self: Self, width: float) -> int:
+        """
+        Method to round a page width down to it's bucket
+
+        :params: width : Page width
+        :return: Bucket width
+        """
+        return int(width) // self.bucket_size * self.bucket_size
+
+    def width(self: Self, ratio: float) -> float:
+        """
+        Method to return width of page width ratio in current bucket
+
+        :params: ratio : Page width is divided by it (e.g. 1.26)
+        :return: Width
+        """
+        with self.lock:
+            return self.bucket_width(ratio)
+
+    def bucket_width(self: Self, ratio: float) -> float:
+        """
+        Method to return width of page width ratio in current bucket
+        (lock must be held)
+
+        :params: ratio : Page width is divided by it
+        :return: Width
+        """
+        key: Tuple[int, float] = (self.bucket, ratio)
+        if (width := self.widths.get(key)) is None:
+            width = self.widths[key] = self.bucket / ratio
+        return width
+
+    def fit(self: Self, control: ControlT, ratio: Optional[float]) -> ControlT:
+        """
+        Method to give a control it's width and keep it in layout
+        (None ratio gives control it's natural width)
+
+        :params:
+            control : Control to lay out
+            ratio   : Page width is divided by it (None for no width)
+
+        :return: Control
+        """
+        with self.lock:
+            if ratio is None:
+                control.width = None
+                self.controls.pop(control, None)
+            else:
+                control.width = self.bucket_width(ratio)
+                self.controls[control] = ratio
+        return control
+
+    def resized(self: Self, e: ft.WindowResizeEvent) -> NoReturn:
+        """
+        Method to handle page resize, layout is done once resizing
+        stops for a while
+
+        :params: e : Resize event
+        :return: None
+        """
+        with self.lock:
+            self.stats["resizes"] += 1
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self.layout, args=(e.width,))
+            self.timer.daemon = True
+            self.timer.start()
+
+    def layout(self: Self, width: float) -> NoReturn:
+        """
+        Method to lay out controls again for a page width, controls
+        on page are sent in one flush of update scheduler (others
+        are sent with their view)
+
+        :params: width : Page width
+        :return: None
+        """
+        with self.lock:
+            self.timer = None
+            bucket: int = self.to_bucket(width)
+            if bucket == self.bucket:
+                return None
+            self.bucket = bucket
+            self.widths.clear()
+
+            # Widths are set under lock, so controls fitted while
+            # laying out get the new bucket too
+            controls: List[Tuple[ft.Control, float]] = list(self.controls.items())
+            for control, ratio in controls:
+                control.width = self.bucket_width(ratio)
+
+        with self.page.scheduler.batch():
+            self.page.scheduler.mark(*(
+                control for control, ratio in controls if control.page is not None
+            ))
+
+        with self.lock:
+            self.stats["layouts"] += 1
+            self.stats["controls"] += len(controls)
+
+    def summary(self: Self) -> Dict[str, Any]:
+        """
+        Method to return layout state for tuning (resize events,
+        layouts done and controls in layout)
+
+        :params: Self
+        :return: Layout summary
+        """
+        with self.lock:
+            return {
+                "bucket": self.bucket,
+                "tracked": len(self.controls),
+                "resizes": self.stats["resizes"],
+                "layouts": self.stats["layouts"],
+                "controls_per_layout": (
+                    self.stats["controls"] / self.stats["layouts"]
+                    if self.stats["layouts"] else 0.0
+                )
+            }
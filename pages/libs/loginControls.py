@@ -3,7 +3,7 @@
 
 # Standard Libraries
 import time
-from typing import NoReturn, Self, Union
+from typing import NoReturn, Self, Union, Optional, Callable
 
 # 3rd-party Libraries
 import flet as ft
@@ -17,12 +17,14 @@ class DialButton:
                  number: str,
                  text: Union[None, str],
                  page: ft.Page,
-                 phone_input: ft.TextField) -> NoReturn:
+                 phone_input: ft.TextField,
+                 on_change: Optional[Callable[[], None]] = None) -> NoReturn:
 
         self.number: str = number
         self.text: str = text or "   "
         self.page: ft.Page = page
         self.phone_input: ft.TextField = phone_input
+        self.on_change: Optional[Callable[[], None]] = on_change
 
     def build(self: Self) -> ft.TextButton:
         """
@@ -41,9 +43,13 @@ class DialButton:
                 number     : digit
             :return: None
             """
-            # Add digit to input and update control
+            # Add digit to input and mark control for update
             phone_input.value += str(number)
-            phone_input.update()
+            self.page.scheduler.mark(phone_input)
+
+            # Notify the page about new phone number
+            if self.on_change:
+                self.on_change()
 
         return ft.TextButton(
             # Number row (e.g. "2 ABC")
@@ -86,7 +92,8 @@ class DialButton:
     @staticmethod
     def icon_only(icon_name: str,
                   page: ft.Page,
-                  phone_input: ft.TextField) -> ft.TextButton:
+                  phone_input: ft.TextField,
+                  on_change: Optional[Callable[[], None]] = None) -> ft.TextButton:
         """
         Static method to return only button with Icon (backspace 
         icon in dial button)
@@ -95,6 +102,7 @@ class DialButton:
             icon_name   : Name of the icon
             page        : Page layout
             phone_input : Text field
+            on_change   : Callback for phone number change
 
         :return: Text Button
 
@@ -108,9 +116,13 @@ class DialButton:
 
             :return: None
             """
-            # Delete digit and update control
+            # Delete digit and mark control for update
             phone_input.value = phone_input.value[:-1]
-            phone_input.update()
+            page.scheduler.mark(phone_input)
+
+            # Notify the page about new phone number
+            if on_change:
+                on_change()
 
         # Return custom control
         return ft.TextButton(
@@ -171,7 +183,7 @@ class OTPButton:
                         color="#ffffff"
                     )
                     control.style.side[""].color = "#489ddf"
-                    control.update()
+                    self.page.scheduler.mark(control)
 
                     # If all inputs are filled, go to menu page
                     if idx == 5:
@@ -179,9 +191,10 @@ class OTPButton:
                         time.sleep(0.5)
 
                         # Change color of inputs to green with animation
+                        # (one input per frame)
                         for control in self.phone_inputs:
                             control.style.side[""].color = "#34b118"
-                            control.update()
+                            self.page.scheduler.mark(control)
                             time.sleep(0.1)
 
                         # Sleep for 1 second and go to menu
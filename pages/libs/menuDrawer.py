@@ -46,9 +46,8 @@ class MenuDrawer:
                 )
                 accounts_show_button.icon = "keyboard_arrow_up"
             
-            # Update the container and button
-            profile_container.update()
-            accounts_show_button.update()
+            # Update the container and button (in one round trip)
+            self.page.scheduler.mark(profile_container, accounts_show_button)
 
         def goto_my_profile() -> NoReturn:
             """
@@ -57,23 +56,9 @@ class MenuDrawer:
             :params: None
             :return: None
             """
-            # Updte database
-            db : Dict[str, Any] = self.page.database
-            db["chat"]["id"] = db["id"]
-            db["chat"]["profile"] = db["profile"]
-            db["chat"]["name"] = db["name"]
-            db["chat"]["phone_number"] = db["phone_number"]
-            db["chat"]["username"] = db["username"]
-            db["chat"]["birth"] = db["birth"]
-            db["chat"]["status"] = db["status"]
-            db["chat"]["bio"] = db["bio"]
-            db["chat"]["has_story"] = db["has_story"]
-            db["chat"]["channel"] = db["channel"]
-            db["chat"]["story_seen"] = False
-
             # Register last page and open profile
             self.page.database["last_page"] = "/menu"
-            self.page.go("/profile")
+            self.page.go(f"/profile/{self.page.database["id"]}")
 
         # Initialize the database
         db: Dict[str, Any] = self.page.database
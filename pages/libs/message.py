@@ -2,27 +2,43 @@
 # -*- coding: utf-8 -*-
 
 # Standard Libraries
-from typing import NoReturn, Self, Dict
+from typing import NoReturn, Self, Optional, Dict
 
 # 3rd-party Libraries
 import flet as ft
 
+# Local Libraries
+from pages.libs.messageStyle import MessageStyle
+
+class MessageRow(ft.Row):
+    """
+    Row of a chat history entry, it's isolated: updates of it's
+    list view don't walk into it (only it's own update() does),
+    so adding a message doesn't diff every shown message
+    """
+    def is_isolated(self: Self) -> bool:
+        return True
+
 class Message:
     """
     Custom message control
     """
+    __slots__ = ("message", "time", "role", "seen", "page", "key")
+
     def __init__(self: Self,
                  message: str, 
                  time: str, 
                  role: str, 
                  seen: bool, 
-                 page: ft.page) -> NoReturn:
+                 page: ft.page,
+                 key: Optional[str] = None) -> NoReturn:
 
         self.message: str = message
         self.time: str = time
         self.role: str = role
         self.seen: bool = seen
         self.page: ft.page = page
+        self.key: Optional[str] = key
 
     def build(self: Self) -> ft.Row:
         """
@@ -31,63 +47,86 @@ class Message:
         :params: Self
         :return: ft.Row
         """
+        # Shared style objects of the role
+        style: MessageStyle = MessageStyle.get(self.role)
+
         # Main row control
-        main_row = ft.Row(
+        main_row = MessageRow(
+            # Key to scroll chat history to this message
+            key=self.key,
             # Set the alignment based on the role 
-            alignment="end" if self.role == "self" else "start",
+            alignment=style.alignment,
             controls=[
                 ft.Container(
                     padding=10,
-                    gradient=ft.LinearGradient(
-                        begin=ft.alignment.top_center,
-                        end=ft.alignment.bottom_center,
-                        colors=[
-                            "#00364f", "#0e141a"
-                        ] if self.role == "partner" else [
-                            "#2b5f86", "#306894"
-                        ],
-                    ),
-                    shadow=ft.BoxShadow(
-                        spread_radius=0,
-                        blur_radius=10,
-                        color="#10000000",
-                        offset=ft.Offset(0, 0),
-                        blur_style=ft.ShadowBlurStyle.SOLID,
-                    ),
-                    content=ft.Row(
+                    gradient=style.gradient,
+                    shadow=style.shadow,
+                    # Long messages wrap at a page width ratio
+                    content=self.page.layout_cache.fit(ft.Row(
                         alignment="space_between",
                         spacing=5,
                         wrap=True,
                         run_spacing=1,
-                        width=self.page.width / 1.26 if len(self.message) > 40 else None,
                         controls=[
                             ft.Text(
                                 value=self.message,
                             ),
-                            status_column := ft.Column(
-                                spacing=0,
-                                alignment=ft.MainAxisAlignment.START,
-                                controls=[
-                                    ft.Text(
-                                        value=self.time,
-                                        color="#bbbbbb"
-                                    )
-                                ]
+                            ft.Text(
+                                value=self.time,
+                                color=style.time_color
                             ),
                             ft.Icon(
                                 name="done_all" if self.seen else "check",
                                 size=16
                             )
                         ]
-                    ),
-                    border_radius=ft.border_radius.only(
-                        7, 7, 0, 7
-                    ) if self.role == "partner" else ft.border_radius.only(
-                        7, 7, 7, 0
-                    )
+                    ), 1.26 if len(self.message) > 40 else None),
+                    border_radius=style.border_radius
                 )
             ]
         )
 
         # Return the message control
-        return main_row
\ No newline at end of file
+        return main_row
+
+    def bind(self: Self, main_row: ft.Row) -> ft.Row:
+        """
+        Method to rebind a control made by build() to this message
+        (used by message pool)
+
+        :params: main_row : Control made by build()
+        :return: ft.Row
+        """
+        # Shared style objects of the role
+        style: MessageStyle = MessageStyle.get(self.role)
+
+        # Controls of the tree (bubble, it's content and values)
+        bubble: ft.Container = main_row.controls[0]
+        content: ft.Row = bubble.content
+        text, time, icon = content.controls
+
+        main_row.key = self.key
+        main_row.alignment = style.alignment
+        bubble.gradient = style.gradient
+        bubble.shadow = style.shadow
+        bubble.border_radius = style.border_radius
+        self.page.layout_cache.fit(content, 1.26 if len(self.message) > 40 else None)
+        text.value = self.message
+        time.value = self.time
+        time.color = style.time_color
+        icon.name = "done_all" if self.seen else "check"
+
+        # Return the message control
+        return main_row
+
+    @staticmethod
+    def mark_seen(main_row: ft.Row) -> ft.Row:
+        """
+        Static method to show a control made by build() as seen
+        (check icon becomes done_all when message is acked)
+
+        :params: main_row : Control made by build()
+        :return: ft.Row
+        """
+        main_row.controls[0].content.controls[2].name = "done_all"
+        return main_row
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import os
+import json
+import mmap
+import threading
+from array import array
+from typing import NoReturn, Self, Optional, Iterable, List, Dict, Set, Any
+
+class MessageLog:
+    """
+    Append-only chat history logs, every chat has a JSON lines
+    log (<id>.jsonl, one message per line) and a sidecar index
+    (<id>.idx, start offset of every line as uint64), so message
+    seq is it's line number (lines are only changed in place to
+    mark sent messages as seen)
+    """
+    def __init__(self: Self, directory: str) -> NoReturn:
+        self.directory: str = directory
+        self.lock: threading.RLock = threading.RLock()
+        self.checked: Set[str] = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def log_path(self: Self, chat_id: str) -> str:
+        """
+        Method to return path of chat log
+
+        :params: chat_id : Chat Id
+        :return: Log path
+        """
+        return os.path.join(self.directory, f"{chat_id}.jsonl")
+
+    def index_path(self: Self, chat_id: str) -> str:
+        """
+        Method to return path of chat log index
+
+        :params: chat_id : Chat Id
+        :return: Index path
+        """
+        return os.path.join(self.directory, f"{chat_id}.idx")
+
+    def chat_ids(self: Self) -> List[str]:
+        """
+        Method to return ids of chats which have a log
+
+        :params: Self
+        :return: List of chat ids
+        """
+        return [
+            name[:-len(".jsonl")]
+            for name in os.listdir(self.directory) if name.endswith(".jsonl")
+        ]
+
+    def recover(self: Self, chat_id: str) -> NoReturn:
+        """
+        Method to make log and index agree after an interrupted
+        append (torn last line is dropped, missing offsets are
+        added), it runs once per chat
+
+        :params: chat_id : Chat Id
+        :return: None
+        """
+        if chat_id in self.checked or not os.path.exists(self.log_path(chat_id)):
+            return None
+        self.checked.add(chat_id)
+
+        with open(self.log_path(chat_id), "r+b") as log:
+            size: int = os.fstat(log.fileno()).st_size
+
+            # Drop torn last line
+            if size:
+                with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    end: int = view.rfind(b"\n") + 1
+                if end != size:
+                    log.truncate(end)
+                    size = end
+
+            # Load index (torn last offset is dropped) and drop
+            # offsets past end of log
+            offsets: array = array("Q")
+            if os.path.exists(self.index_path(chat_id)):
+                with open(self.index_path(chat_id), "rb") as index:
+                    raw: bytes = index.read()
+                offsets.frombytes(raw[:len(raw) // 8 * 8])
+            while offsets and offsets[-1] >= size:
+                offsets.pop()
+
+            # Index lines again from last indexed line
+            start: int = offsets.pop() if offsets else 0
+            log.seek(start)
+            data: bytes = log.read()
+            position: int = 0
+            while position < len(data):
+                offsets.append(start + position)
+                position = data.index(b"\n", position) + 1
+
+        with open(self.index_path(chat_id), "wb") as index:
+            offsets.tofile(index)
+
+    def count(self: Self, chat_id: str) -> int:
+        """
+        Method to return number of messages in chat log
+
+        :params: chat_id : Chat Id
+        :return: Number of messages
+        """
+        with self.lock:
+            self.recover(chat_id)
+            try:
+                return os.path.getsize(self.index_path(chat_id)) // 8
+            except FileNotFoundError:
+                return 0
+
+    def append(self: Self,
+               chat_id: str,
+               messages: Iterable[Dict[str, Any]]) -> int:
+        """
+        Method to append messages to end of chat log (O(1), log
+        and index are only appended)
+
+        :params:
+            chat_id  : Chat Id
+            messages : Messages to append
+
+        :return: Seq of the last message in chat
+        """
+        with self.lock:
+            self.recover(chat_id)
+            with open(self.log_path(chat_id), "ab") as log:
+                position: int = log.tell()
+                offsets: array = array("Q")
+                lines: List[bytes] = []
+                for message in messages:
+                    line: bytes = json.dumps(
+                        {key: val for key, val in message.items() if key != "seq"},
+                        ensure_ascii=False,
+                        separators=(",", ":")
+                    ).encode() + b"\n"
+                    offsets.append(position)
+                    lines.append(line)
+                    position += len(line)
+                log.write(b"".join(lines))
+
+            # Index is written after log, so a crash in between is
+            # recovered from the log
+            with open(self.index_path(chat_id), "ab") as index:
+                offsets.tofile(index)
+                return index.tell() // 8 - 1
+
+    def read(self: Self,
+             chat_id: str,
+             start: int,
+             stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Method to read a range of messages using the index (only
+        the requested bytes are read from log)
+
+        :params:
+            chat_id : Chat Id
+            start   : Seq of first message
+            stop    : Seq after last message (None for end)
+
+        :return: List of messages (oldest first)
+        """
+        with self.lock:
+            total: int = self.count(chat_id)
+            stop = total if stop is None else min(stop, total)
+            start = max(start, 0)
+            if start >= stop:
+                return []
+
+            # Find byte range of messages from index
+            offsets: array = array("Q")
+            with open(self.index_path(chat_id), "rb") as index:
+                index.seek(start * 8)
+                offsets.frombytes(index.read((stop - start + 1) * 8))
+
+            with open(self.log_path(chat_id), "rb") as log:
+                log.seek(offsets[0])
+                data: bytes = log.read(
+                    offsets[stop - start] - offsets[0] if stop < total else -1
+                )
+
+        return [
+            json.loads(line) | {"seq": seq}
+            for seq, line in enumerate(data.split(b"\n")[:-1], start=start)
+        ]
+
+    def tail(self: Self, chat_id: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Method to read last messages of chat by seeking backwards
+        from end of log (without parsing the whole log)
+
+        :params:
+            chat_id : Chat Id
+            count   : Number of messages
+
+        :return: List of messages (oldest first)
+        """
+        with self.lock:
+            total: int = self.count(chat_id)
+            if not total or count <= 0:
+                return []
+
+            lines: List[bytes] = []
+            with open(self.log_path(chat_id), "rb") as log:
+                with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    # Every line ends with "\n", walk back line by line
+                    end: int = len(view) - 1
+                    while len(lines) < count and end >= 0:
+                        start: int = view.rfind(b"\n", 0, end) + 1
+                        lines.append(view[start:end])
+                        end = start - 1
+
+        return [
+            json.loads(line) | {"seq": total - number}
+            for number, line in reversed(list(enumerate(lines, start=1)))
+        ]
+
+    def drop(self: Self, chat_id: str) -> NoReturn:
+        """
+        Method to remove chat log and it's index (e.g. a history
+        which was only partly imported)
+
+        :params: chat_id : Chat Id
+        :return: None
+        """
+        with self.lock:
+            for path in (self.log_path(chat_id), self.index_path(chat_id)):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self.checked.discard(chat_id)
+
+    def mark_seen(self: Self, chat_id: str, seqs: Iterable[int]) -> NoReturn:
+        """
+        Method to mark messages as seen, it's the only change made
+        in place ("false" becomes "true " so lines keep their length
+        and index stays valid)
+
+        :params:
+            chat_id : Chat Id
+            seqs    : Seqs of messages
+
+        :return: None
+        """
+        with self.lock:
+            total: int = self.count(chat_id)
+            if not total:
+                return None
+            with (
+                open(self.index_path(chat_id), "rb") as index,
+                open(self.log_path(chat_id), "r+b") as log
+            ):
+                for seq in sorted(set(seqs)):
+                    if not 0 <= seq < total:
+                        continue
+
+                    # Byte range of line from index
+                    offsets: array = array("Q")
+                    index.seek(seq * 8)
+                    offsets.frombytes(index.read(16))
+                    log.seek(offsets[0])
+                    line: bytes = log.read(
+                        offsets[1] - offsets[0] if len(offsets) > 1 else -1
+                    )
+
+                    # Quotes of message text are escaped, so only the
+                    # key matches
+                    if (position := line.rfind(b'"seen":false')) != -1:
+                        log.seek(offsets[0] + position)
+                        log.write(b'"seen":true ')
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import time
+import threading
+from weakref import WeakSet
+from typing import NoReturn, Self, Optional, Iterable, List, Dict, Any
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from pages.libs.message import Message
+
+class MessagePool:
+    """
+    Pool of built message controls, controls dropped by history
+    windows are released to pool and rebound to other messages
+    (values, icon and alignment are changed) instead of building
+    new control trees
+
+    Note: release controls only after they are removed from page
+    (after the update which removed them)
+    """
+    def __init__(self: Self, capacity: Optional[int] = 400) -> NoReturn:
+        self.capacity: int = capacity
+        self.lock: threading.Lock = threading.Lock()
+        self.free: List[ft.Row] = []
+        self.owned: WeakSet[ft.Row] = WeakSet()
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "dropped": 0,
+            "rebind_ns": 0
+        }
+
+    def acquire(self: Self, message: Message) -> ft.Row:
+        """
+        Method to return control of a message, a free control is
+        rebound to it or a new one is built if pool is empty
+
+        :params: message : Message
+        :return: Message control
+        """
+        with self.lock:
+            control: Optional[ft.Row] = self.free.pop() if self.free else None
+            self.stats["hits" if control is not None else "misses"] += 1
+        if control is None:
+            control = message.build()
+            with self.lock:
+                self.owned.add(control)
+            return control
+
+        start: int = time.perf_counter_ns()
+        message.bind(control)
+        with self.lock:
+            self.stats["rebind_ns"] += time.perf_counter_ns() - start
+        return control
+
+    def release(self: Self, controls: Iterable[ft.Control]) -> NoReturn:
+        """
+        Method to give controls back to pool, controls which are
+        not built by pool are skipped and controls over capacity
+        are dropped
+
+        :params: controls : Removed controls
+        :return: None
+        """
+        with self.lock:
+            for control in controls:
+                if control not in self.owned:
+                    continue
+                if len(self.free) < self.capacity:
+                    self.free.append(control)
+                else:
+                    self.owned.discard(control)
+                    self.stats["dropped"] += 1
+
+    def summary(self: Self) -> Dict[str, Any]:
+        """
+        Method to return pool state for tuning (free controls,
+        capacity, hit rate and mean rebind time)
+
+        :params: Self
+        :return: Pool summary
+        """
+        with self.lock:
+            requests: int = self.stats["hits"] + self.stats["misses"]
+            return {
+                "free": len(self.free),
+                "capacity": self.capacity,
+                "hits": self.stats["hits"],
+                "misses": self.stats["misses"],
+                "dropped": self.stats["dropped"],
+                "hit_rate": self.stats["hits"] / requests if requests else 0.0,
+                "rebind_us": (
+                    self.stats["rebind_ns"] / self.stats["hits"] / 1000
+                    if self.stats["hits"] else 0.0
+                )
+            }
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import sys
+from enum import IntEnum
+from array import array
+from typing import NoReturn, Self, Optional, Iterable, Iterator, List, Dict, Any
+
+class Role(IntEnum):
+    """
+    Role of message sender (stored as one byte in history buffers)
+    """
+    SELF = 0
+    PARTNER = 1
+    SYSTEM = 2
+
+    @property
+    def label(self: Self) -> str:
+        """
+        Property to return role as written in message dicts
+
+        :params: Self
+        :return: Role label ("self", "partner" or "system")
+        """
+        return self.name.lower()
+
+    @classmethod
+    def parse(cls, label: str) -> "Role":
+        """
+        Class method to return role of a role label
+
+        :params: label : Role label
+        :return: Role
+        """
+        return cls[label.upper()]
+
+class MessageRecord:
+    """
+    Typed message record with slots (no per-message dict)
+    """
+    __slots__ = ("seq", "role", "message", "time", "seen")
+
+    def __init__(self: Self,
+                 role: Role,
+                 time: str,
+                 message: Optional[str] = None,
+                 seen: Optional[bool] = None,
+                 seq: Optional[int] = None) -> NoReturn:
+
+        self.seq: Optional[int] = seq
+        self.role: Role = role
+        self.message: Optional[str] = message
+        self.time: str = time
+        self.seen: Optional[bool] = seen
+
+    @classmethod
+    def from_dict(cls, message: Dict[str, Any]) -> "MessageRecord":
+        """
+        Class method to make record from message dict (same format
+        as data/messages/*.json)
+
+        :params: message : Message dict
+        :return: Message record
+        """
+        return cls(
+            role=Role.parse(message["role"]),
+            time=sys.intern(message["time"]),
+            message=message.get("message"),
+            seen=message.get("seen"),
+            seq=message.get("seq")
+        )
+
+    def to_dict(self: Self) -> Dict[str, Any]:
+        """
+        Method to turn record into message dict
+
+        :params: Self
+        :return: Message dict
+        """
+        if self.role is Role.SYSTEM:
+            return {"role": self.role.label, "time": self.time}
+        return {
+            "role": self.role.label,
+            "message": self.message,
+            "time": self.time,
+            "seen": self.seen
+        }
+
+class HistoryBuffer:
+    """
+    Columnar chat history, role, seen and time columns are kept
+    in arrays (time as index of interned time label) and records
+    are made on access
+    """
+    # Seen column values
+    UNSET: int = 2
+
+    def __init__(self: Self, start: Optional[int] = 0) -> NoReturn:
+        self.start: int = start
+        self.roles: array = array("B")
+        self.seen: array = array("B")
+        self.times: array = array("I")
+        self.messages: List[Optional[str]] = []
+
+        # Time labels are repeated a lot, keep every label once
+        self.labels: List[str] = []
+        self.label_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_messages(cls,
+                      messages: Iterable[Dict[str, Any]],
+                      start: Optional[int] = None) -> "HistoryBuffer":
+        """
+        Class method to make buffer from message dicts
+
+        :params:
+            messages : Message dicts (oldest first)
+            start    : Seq of first message (None to take it from
+                       first message or 0)
+
+        :return: History buffer
+        """
+        buffer: HistoryBuffer = cls(start=start or 0)
+        for message in messages:
+            if start is None:
+                buffer.start = start = message.get("seq", 0)
+            buffer.append(message)
+        return buffer
+
+    def append(self: Self, message: Dict[str, Any]) -> NoReturn:
+        """
+        Method to append a message dict to end of buffer
+
+        :params: message : Message dict
+        :return: None
+        """
+        label: str = message["time"]
+        if (label_id := self.label_ids.get(label)) is None:
+            label_id = self.label_ids[label] = len(self.labels)
+            self.labels.append(sys.intern(label))
+
+        self.roles.append(Role.parse(message["role"]))
+        self.seen.append(
+            self.UNSET if message.get("seen") is None else int(message["seen"])
+        )
+        self.times.append(label_id)
+        self.messages.append(message.get("message"))
+
+    def extend(self: Self, messages: Iterable[Dict[str, Any]]) -> NoReturn:
+        """
+        Method to append message dicts to end of buffer
+
+        :params: messages : Message dicts (oldest first)
+        :return: None
+        """
+        for message in messages:
+            self.append(message)
+
+    def __len__(self: Self) -> int:
+        return len(self.roles)
+
+    def __getitem__(self: Self, index: int) -> MessageRecord:
+        """
+        Method to make record of a message in buffer
+
+        :params: index : Index of message in buffer
+        :return: Message record
+        """
+        if index < 0:
+            index += len(self)
+        seen: int = self.seen[index]
+        return MessageRecord(
+            role=Role(self.roles[index]),
+            time=self.labels[self.times[index]],
+            message=self.messages[index],
+            seen=None if seen == self.UNSET else bool(seen),
+            seq=self.start + index
+        )
+
+    def __iter__(self: Self) -> Iterator[MessageRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self: Self) -> Iterator[MessageRecord]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
@@ -0,0 +1,598 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import os
+import json
+import glob
+import sqlite3
+import threading
+from itertools import islice
+from typing import NoReturn, Self, Optional, Iterable, Iterator, Tuple, List, Dict, Set, Any
+
+# Local Libraries
+from pages.libs.messageLog import MessageLog
+from pages.libs.jsonStream import iter_array
+from pages.libs.messageRecord import HistoryBuffer
+from pages.libs.assetCache import load_json
+from pages.libs.searchIndex import MessageIndex, Vocabulary
+
+# Database schema (chats, summary of their histories, outbox of
+# sent messages and store state, histories are kept in append-only
+# message logs and acked outbox messages are marked seen in logs
+# and dropped)
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS meta (
+    key      TEXT PRIMARY KEY,
+    value    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chats (
+    id       TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chat_summary (
+    chat_id  TEXT PRIMARY KEY,
+    seq      INTEGER NOT NULL,
+    role     TEXT NOT NULL,
+    message  TEXT,
+    time     TEXT NOT NULL,
+    seen     INTEGER,
+    unread   INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    chat_id  TEXT NOT NULL,
+    seq      INTEGER NOT NULL,
+    message  TEXT NOT NULL,
+    time     TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    retry_at REAL NOT NULL DEFAULT 0,
+    acked    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (chat_id, seq)
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (acked, retry_at);
+"""
+
+# Number of messages appended to log at once on import
+IMPORT_BATCH: int = 1000
+
+# Number of messages read from log at once to build search index
+INDEX_BATCH: int = 5000
+
+# Number of messages read back from log at once to find last date
+DATE_BATCH: int = 500
+
+class MessageStore:
+    """
+    Store for chats and chat histories, chats and chat summary
+    are kept in SQLite and histories in append-only message logs
+    """
+    def __init__(self: Self, path: str, log_directory: str) -> NoReturn:
+        self.path: str = path
+        self.lock: threading.Lock = threading.Lock()
+        self.append_lock: threading.Lock = threading.Lock()
+        self.log: MessageLog = MessageLog(log_directory)
+        self.index_lock: threading.Lock = threading.Lock()
+        self.indexes: Dict[str, MessageIndex] = {}
+        self.vocabulary: Vocabulary = Vocabulary()
+
+        # Date of last separator of chats (found on first receive
+        # and kept by append)
+        self.dates: Dict[str, Optional[str]] = {}
+
+        # Connection is shared between Flet handler threads
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            path,
+            check_same_thread=False
+        )
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+
+        # Build chat summary for stores created without it
+        with self.lock:
+            outdated: bool = not self.connection.execute(
+                "SELECT 1 FROM chat_summary LIMIT 1"
+            ).fetchone()
+        if outdated and self.log.chat_ids():
+            self.rebuild_summary()
+
+        # Drop outbox messages which were acked but not marked seen
+        # in logs (e.g. app was closed in between)
+        self.outbox_compact()
+
+    @staticmethod
+    def to_message(row: sqlite3.Row) -> Dict[str, Any]:
+        """
+        Static method to turn message row into message dict (same
+        format as data/messages/*.json)
+
+        :params: row : Message row
+        :return: Message dict
+        """
+        if row["role"] == "system":
+            return {
+                "seq": row["seq"],
+                "role": row["role"],
+                "time": row["time"]
+            }
+        return {
+            "seq": row["seq"],
+            "role": row["role"],
+            "message": row["message"],
+            "time": row["time"],
+            "seen": bool(row["seen"])
+        }
+
+    def chats(self: Self) -> List[Dict[str, Any]]:
+        """
+        Method to return all chats in their original order
+
+        :params: Self
+        :return: List of chats
+        """
+        with self.lock:
+            rows: List[sqlite3.Row] = self.connection.execute(
+                "SELECT data FROM chats ORDER BY position"
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def last_messages(self: Self) -> Dict[str, Dict[str, Any]]:
+        """
+        Method to return last message of every chat (read from
+        end of message logs)
+
+        :params: Self
+        :return: Map of chat id -> last message
+        """
+        return {
+            chat_id: last[0]
+            for chat_id in self.log.chat_ids()
+            if (last := self.log.tail(chat_id, 1))
+        }
+
+    def summaries(self: Self) -> Dict[str, Dict[str, Any]]:
+        """
+        Method to return chat summaries (last message and unread
+        count of every chat) without reading chat histories
+
+        :params: Self
+        :return: Map of chat id -> summary
+        """
+        with self.lock:
+            rows: List[sqlite3.Row] = self.connection.execute(
+                "SELECT * FROM chat_summary"
+            ).fetchall()
+        return {
+            row["chat_id"]: self.to_message(row) | {"unread": row["unread"]}
+            for row in rows
+        }
+
+    def rebuild_summary(self: Self) -> NoReturn:
+        """
+        Method to build chat summary from chat histories, unread
+        counts are taken from chats data
+
+        :params: Self
+        :return: None
+        """
+        counts: Dict[str, int] = {
+            chat["id"]: chat.get("count", 0) for chat in self.chats()
+        }
+        rows: List[tuple] = [
+            (
+                chat_id,
+                last["seq"],
+                last["role"],
+                last.get("message"),
+                last["time"],
+                last.get("seen"),
+                counts.get(chat_id, 0)
+            )
+            for chat_id, last in self.last_messages().items()
+        ]
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM chat_summary")
+            self.connection.executemany(
+                "INSERT INTO chat_summary VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def count(self: Self, chat_id: str) -> int:
+        """
+        Method to return number of messages in chat history
+
+        :params: chat_id : Chat Id
+        :return: Number of messages
+        """
+        return self.log.count(chat_id)
+
+    def messages_before(self: Self,
+                        chat_id: str,
+                        seq: Optional[int] = None,
+                        limit: Optional[int] = None) -> HistoryBuffer:
+        """
+        Method to return a page of messages before a message
+
+        :params:
+            chat_id : Chat Id
+            seq     : Page ends before this seq (None for latest)
+            limit   : Page size (None for whole history)
+
+        :return: History buffer of messages (oldest first)
+        """
+        # Latest page is read from end of log
+        if seq is None and limit is not None:
+            buffer: HistoryBuffer = HistoryBuffer.from_messages(
+                self.log.tail(chat_id, limit)
+            )
+        else:
+            stop: int = seq if seq is not None else self.log.count(chat_id)
+            start: int = max(stop - limit, 0) if limit is not None else 0
+            buffer = HistoryBuffer.from_messages(
+                self.log.read(chat_id=chat_id, start=start, stop=stop),
+                start=start
+            )
+        return buffer
+
+    def message_index(self: Self, chat_id: str) -> MessageIndex:
+        """
+        Method to return search index of a chat, it's built from
+        log on first use (in batches) and appended messages are
+        indexed by append()
+
+        :params: chat_id : Chat Id
+        :return: Message index
+        """
+        with self.index_lock:
+            if chat_id in self.indexes:
+                return self.indexes[chat_id]
+            index: MessageIndex = MessageIndex(
+                vocabulary=self.vocabulary,
+                key=chat_id
+            )
+            total: int = self.log.count(chat_id)
+            while index.count < total:
+                messages: List[Dict[str, Any]] = self.log.read(
+                    chat_id=chat_id,
+                    start=index.count,
+                    stop=index.count + INDEX_BATCH
+                )
+                if not messages:
+                    break
+                index.extend(messages)
+            self.indexes[chat_id] = index
+            return index
+
+    def search(self: Self,
+               chat_id: str,
+               query: str,
+               limit: Optional[int] = None) -> List[int]:
+        """
+        Method to search message text of a chat
+
+        :params:
+            chat_id : Chat Id
+            query   : Search query (last word may be a prefix)
+            limit   : Maximum number of results (None for all)
+
+        :return: List of matching seqs (newest first)
+        """
+        return self.message_index(chat_id).search(query, limit)
+
+    def append(self: Self,
+               chat_id: str,
+               messages: Iterable[Dict[str, Any]]) -> int:
+        """
+        Method to append a batch of messages to chat history and
+        update chat summary
+
+        :params:
+            chat_id  : Chat Id
+            messages : Messages to append
+
+        :return: Seq of the last message in chat
+        """
+        messages = list(messages)
+
+        # Appends are done one at a time, so chat summary always
+        # ends with the newest batch of log
+        with self.append_lock:
+            seq: int = self.log.append(chat_id, messages)
+            if not messages:
+                return seq
+
+            # Keep last date of chat if it's known
+            with self.lock:
+                if chat_id in self.dates:
+                    for message in messages:
+                        if message["role"] == "system":
+                            self.dates[chat_id] = message["time"]
+
+            # Index messages if chat is indexed (skip ones which index
+            # has read from log while being built)
+            with self.index_lock:
+                if (index := self.indexes.get(chat_id)) is not None:
+                    for number, message in enumerate(messages, start=seq - len(messages) + 1):
+                        if number >= index.count:
+                            index.add(number, message.get("message"))
+
+            # Last message of batch becomes chat summary, partner
+            # messages are counted as unread
+            with self.lock, self.connection:
+                self.connection.execute(
+                    """
+                    INSERT INTO chat_summary VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (chat_id) DO UPDATE SET
+                        seq = excluded.seq,
+                        role = excluded.role,
+                        message = excluded.message,
+                        time = excluded.time,
+                        seen = excluded.seen,
+                        unread = unread + excluded.unread
+                    """,
+                    (
+                        chat_id,
+                        seq,
+                        messages[-1]["role"],
+                        messages[-1].get("message"),
+                        messages[-1]["time"],
+                        messages[-1].get("seen"),
+                        sum(1 for message in messages if message["role"] == "partner")
+                    )
+                )
+            return seq
+
+    def last_date(self: Self, chat_id: str) -> Optional[str]:
+        """
+        Method to return date of last separator in chat history,
+        log is read back in batches until a separator is found
+
+        :params: chat_id : Chat Id
+        :return: Date label (e.g. "August 9") or None if history
+                 has no separator
+        """
+        with self.lock:
+            if chat_id in self.dates:
+                return self.dates[chat_id]
+
+        date: Optional[str] = None
+        stop: int = self.log.count(chat_id)
+        while stop > 0 and date is None:
+            start: int = max(stop - DATE_BATCH, 0)
+            for message in self.log.read(chat_id=chat_id, start=start, stop=stop):
+                if message["role"] == "system":
+                    date = message["time"]
+            stop = start
+
+        with self.lock:
+            return self.dates.setdefault(chat_id, date)
+
+    def receive(self: Self,
+                chat_id: str,
+                messages: Iterable[Dict[str, Any]]) -> HistoryBuffer:
+        """
+        Method to append a burst of incoming messages (format of
+        data/messages/*.json with "date" of every message), date
+        separators are added where day changes
+
+        :params:
+            chat_id  : Chat Id
+            messages : Incoming messages (oldest first)
+
+        :return: History buffer of appended messages (separators
+                 included)
+        """
+        date: Optional[str] = self.last_date(chat_id)
+        batch: List[Dict[str, Any]] = []
+        for message in messages:
+            if message["date"] != date:
+                date = message["date"]
+                batch.append({"role": "system", "time": date})
+            batch.append({
+                "role": message["role"],
+                "message": message["message"],
+                "time": message["time"],
+                "seen": message.get("seen", False)
+            })
+        seq: int = self.append(chat_id=chat_id, messages=batch)
+        return HistoryBuffer.from_messages(batch, start=seq - len(batch) + 1)
+
+    def outbox_put(self: Self,
+                   chat_id: str,
+                   seq: int,
+                   message: Dict[str, Any]) -> NoReturn:
+        """
+        Method to add a sent message (already in chat history) to
+        outbox, it's kept until transport acks it
+
+        :params:
+            chat_id : Chat Id
+            seq     : Seq of message in chat history
+            message : Message
+
+        :return: None
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO outbox (chat_id, seq, message, time) VALUES (?, ?, ?, ?)",
+                (chat_id, seq, message["message"], message["time"])
+            )
+
+    def outbox_due(self: Self,
+                   now: float,
+                   limit: int,
+                   lease: float) -> List[Dict[str, Any]]:
+        """
+        Method to take outbox messages which are due to be sent,
+        they are not due again until lease ends (so other sessions
+        don't send them too), an ack or retry comes before that
+
+        :params:
+            now   : Current time (seconds since epoch)
+            limit : Maximum number of messages
+            lease : Time they are taken for (seconds)
+
+        :return: Messages (chat_id, seq, message, time and attempts)
+        """
+        with self.lock, self.connection:
+            messages: List[Dict[str, Any]] = [
+                dict(row) for row in self.connection.execute(
+                    """
+                    SELECT chat_id, seq, message, time, attempts FROM outbox
+                    WHERE acked = 0 AND retry_at <= ?
+                    ORDER BY retry_at, chat_id, seq LIMIT ?
+                    """,
+                    (now, limit)
+                )
+            ]
+            self.connection.executemany(
+                "UPDATE outbox SET retry_at = ? WHERE chat_id = ? AND seq = ?",
+                [(now + lease, message["chat_id"], message["seq"]) for message in messages]
+            )
+        return messages
+
+    def outbox_next(self: Self) -> Optional[float]:
+        """
+        Method to return time of next retry in outbox
+
+        :params: Self
+        :return: Time of next retry or None if outbox is empty
+        """
+        with self.lock:
+            return self.connection.execute(
+                "SELECT MIN(retry_at) FROM outbox WHERE acked = 0"
+            ).fetchone()[0]
+
+    def outbox_retry(self: Self,
+                     keys: Iterable[Tuple[str, int]],
+                     now: float,
+                     backoff: float,
+                     max_backoff: float) -> NoReturn:
+        """
+        Method to schedule retry of outbox messages, delay doubles
+        with every attempt
+
+        :params:
+            keys        : Chat Id and seq of messages
+            now         : Current time (seconds since epoch)
+            backoff     : Delay of first retry (seconds)
+            max_backoff : Maximum delay (seconds)
+
+        :return: None
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                """
+                UPDATE outbox SET
+                    attempts = attempts + 1,
+                    retry_at = ? + MIN(? * (1 << MIN(attempts, 30)), ?)
+                WHERE chat_id = ? AND seq = ?
+                """,
+                [(now, backoff, max_backoff, chat_id, seq) for chat_id, seq in keys]
+            )
+
+    def outbox_ack(self: Self, keys: Iterable[Tuple[str, int]]) -> NoReturn:
+        """
+        Method to mark outbox messages as acked (they are shown as
+        seen from now on)
+
+        :params: keys : Chat Id and seq of messages
+        :return: None
+        """
+        keys = list(keys)
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "UPDATE outbox SET acked = 1 WHERE chat_id = ? AND seq = ?",
+                keys
+            )
+            self.connection.executemany(
+                "UPDATE chat_summary SET seen = 1 WHERE chat_id = ? AND seq = ?",
+                keys
+            )
+        self.outbox_compact()
+
+    def outbox_compact(self: Self) -> NoReturn:
+        """
+        Method to mark acked outbox messages as seen in logs and
+        drop them, so outbox only keeps unsent messages
+
+        :params: Self
+        :return: None
+        """
+        with self.lock:
+            rows: List[sqlite3.Row] = self.connection.execute(
+                "SELECT chat_id, seq FROM outbox WHERE acked = 1"
+            ).fetchall()
+        if not rows:
+            return None
+
+        chats: Dict[str, List[int]] = {}
+        for row in rows:
+            chats.setdefault(row["chat_id"], []).append(row["seq"])
+        for chat_id, seqs in chats.items():
+            self.log.mark_seen(chat_id=chat_id, seqs=seqs)
+
+        # Rows are dropped after logs are changed, a crash in between
+        # marks them again on next run
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM outbox WHERE chat_id = ? AND seq = ? AND acked = 1",
+                [(row["chat_id"], row["seq"]) for row in rows]
+            )
+
+    def import_json(self: Self, directory: str) -> bool:
+        """
+        Method to import chats.json and messages/*.json from data
+        directory, it runs until it's done once (an interrupted
+        import is run again, histories which were not done are
+        imported again from start)
+
+        :params: directory : Data directory
+        :return: True if data is imported
+        """
+        with self.lock:
+            done: Set[str] = {
+                row["key"] for row in self.connection.execute(
+                    "SELECT key FROM meta WHERE key LIKE 'imported%'"
+                )
+            }
+        if "imported" in done:
+            return False
+
+        # Import chats
+        chats: List[Dict[str, Any]] = load_json(
+            os.path.join(directory, "chats.json")
+        )
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO chats VALUES (?, ?, ?)",
+                [
+                    (chat["id"], position, json.dumps(chat))
+                    for position, chat in enumerate(chats)
+                ]
+            )
+
+        # Import chat histories and build their summary, histories
+        # are streamed into logs in batches so large exports are
+        # never loaded at once, every history is marked when it's
+        # done and the import when all of them are
+        for path in glob.glob(os.path.join(directory, "messages", "*.json")):
+            chat_id: str = os.path.splitext(os.path.basename(path))[0]
+            if f"imported:{chat_id}" in done:
+                continue
+            self.log.drop(chat_id)
+            messages: Iterator[Dict[str, Any]] = iter_array(path)
+            while batch := list(islice(messages, IMPORT_BATCH)):
+                self.log.append(chat_id=chat_id, messages=batch)
+            with self.lock, self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES (?, '1')",
+                    (f"imported:{chat_id}",)
+                )
+        self.rebuild_summary()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('imported', '1')"
+            )
+        return True
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+from typing import NoReturn, Self, Optional, Tuple, List, Dict
+
+# 3rd-party Libraries
+import flet as ft
+
+# Colors of message bubbles (theme -> role -> colors)
+THEMES: Dict[str, Dict[str, Dict[str, str | List[str]]]] = {
+    "dark": {
+        "self": {
+            "gradient": ["#2b5f86", "#306894"],
+            "time": "#bbbbbb",
+            "shadow": "#10000000"
+        },
+        "partner": {
+            "gradient": ["#00364f", "#0e141a"],
+            "time": "#bbbbbb",
+            "shadow": "#10000000"
+        }
+    }
+}
+
+class MessageStyle:
+    """
+    Shared style of message controls, a style is built once per
+    role and theme and its objects are used by every message of
+    that role (so they must not be changed)
+    """
+    __slots__ = ("alignment", "gradient", "shadow", "border_radius", "time_color")
+
+    # Built styles ((role, theme) -> style)
+    styles: Dict[Tuple[str, str], "MessageStyle"] = {}
+
+    def __init__(self: Self, role: str, theme: str) -> NoReturn:
+        colors: Dict[str, str | List[str]] = THEMES[theme][role]
+        self.alignment: str = "end" if role == "self" else "start"
+        self.gradient: ft.LinearGradient = ft.LinearGradient(
+            begin=ft.alignment.top_center,
+            end=ft.alignment.bottom_center,
+            colors=colors["gradient"]
+        )
+        # Zero spread and offset are client defaults, they are
+        # left out to keep them off the wire
+        self.shadow: ft.BoxShadow = ft.BoxShadow(
+            blur_radius=10,
+            color=colors["shadow"],
+            blur_style=ft.ShadowBlurStyle.SOLID
+        )
+        self.border_radius: ft.BorderRadius = ft.border_radius.only(
+            7, 7, 0, 7
+        ) if role == "partner" else ft.border_radius.only(
+            7, 7, 7, 0
+        )
+        self.time_color: str = colors["time"]
+
+    @classmethod
+    def get(cls, role: str, theme: Optional[str] = "dark") -> "MessageStyle":
+        """
+        Class method to return style of a role, it's built on
+        first use
+
+        :params:
+            role  : Message role ("self" or "partner")
+            theme : Theme name
+
+        :return: Message style
+        """
+        style: Optional[MessageStyle] = cls.styles.get((role, theme))
+        if style is None:
+            style = cls.styles.setdefault((role, theme), cls(role, theme))
+        return style
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import time
+import asyncio
+import threading
+from typing import NoReturn, Self, Optional, Callable, Tuple, List, Set, Dict, Any
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from pages.libs.messageStore import MessageStore
+from pages.libs.transport import Transport
+
+class Outbox:
+    """
+    Queue of sent messages, messages are shown right away and
+    sent by transport in batches on page's event loop, outbox is
+    kept in message store so unsent messages survive restart and
+    failed batches are retried with backoff
+    """
+    def __init__(self: Self,
+                 store: MessageStore,
+                 transport: Transport,
+                 on_ack: Callable[[List[Tuple[str, int]]], None],
+                 batch_size: Optional[int] = 50,
+                 backoff: Optional[float] = 1.0,
+                 max_backoff: Optional[float] = 60.0,
+                 lease: Optional[float] = 30.0) -> NoReturn:
+
+        self.store: MessageStore = store
+        self.transport: Transport = transport
+        self.on_ack: Callable[[List[Tuple[str, int]]], None] = on_ack
+        self.batch_size: int = batch_size
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.lease: float = lease
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.task: Optional[asyncio.Task] = None
+        self.wake: Optional[asyncio.Event] = None
+        self.lock: threading.Lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "queued": 0,
+            "batches": 0,
+            "acked": 0,
+            "failed": 0
+        }
+
+    def start(self: Self, page: ft.Page) -> NoReturn:
+        """
+        Method to start sending on page's event loop (messages
+        left in outbox from last run are sent first)
+
+        :params: page : Flet page
+        :return: None
+        """
+        self.loop = page.loop
+        page.run_task(self.run)
+
+    def stop(self: Self) -> NoReturn:
+        """
+        Method to stop sending (e.g. when session is disconnected),
+        unsent messages are kept in store for next run
+
+        :params: Self
+        :return: None
+        """
+        if self.loop is not None and self.task is not None:
+            self.loop.call_soon_threadsafe(self.task.cancel)
+
+    def put(self: Self,
+            chat_id: str,
+            seq: int,
+            message: Dict[str, Any]) -> NoReturn:
+        """
+        Method to queue a sent message (already in chat history),
+        it can be called from any thread
+
+        :params:
+            chat_id : Chat Id
+            seq     : Seq of message in chat history
+            message : Message
+
+        :return: None
+        """
+        self.store.outbox_put(chat_id=chat_id, seq=seq, message=message)
+        with self.lock:
+            self.stats["queued"] += 1
+        if self.loop is not None and self.wake is not None:
+            self.loop.call_soon_threadsafe(self.wake.set)
+
+    async def run(self: Self) -> NoReturn:
+        """
+        Coroutine to send due messages in batches, it waits for new
+        messages or next retry when nothing is due
+
+        :params: Self
+        :return: None
+        """
+        self.task = asyncio.current_task()
+        self.wake = asyncio.Event()
+        try:
+            while True:
+                # Clear before reading outbox, so a put() which comes
+                # in between wakes the next wait
+                self.wake.clear()
+                batch: List[Dict[str, Any]] = await asyncio.to_thread(
+                    self.store.outbox_due, time.time(), self.batch_size, self.lease
+                )
+                if batch:
+                    await self.send(batch)
+                    continue
+
+                retry_at: Optional[float] = await asyncio.to_thread(self.store.outbox_next)
+                try:
+                    await asyncio.wait_for(
+                        self.wake.wait(),
+                        None if retry_at is None else max(retry_at - time.time(), 0)
+                    )
+                except TimeoutError:
+                    pass
+
+        # Stopped by stop(), messages taken by an unfinished batch
+        # are due again when their lease ends
+        except asyncio.CancelledError:
+            return None
+
+    async def send(self: Self, batch: List[Dict[str, Any]]) -> NoReturn:
+        """
+        Coroutine to send a batch by transport, acked messages are
+        marked in store and shown as seen, others are retried
+
+        :params: batch : Due messages
+        :return: None
+        """
+        # Any failure of transport is retried, sending must go on
+        try:
+            acked: List[Tuple[str, int]] = await self.transport.send(batch)
+        except Exception:
+            acked = []
+
+        done: Set[Tuple[str, int]] = set(acked)
+        failed: List[Tuple[str, int]] = [
+            (message["chat_id"], message["seq"]) for message in batch
+            if (message["chat_id"], message["seq"]) not in done
+        ]
+        if failed:
+            await asyncio.to_thread(
+                self.store.outbox_retry, failed, time.time(), self.backoff, self.max_backoff
+            )
+        if acked:
+            await asyncio.to_thread(self.ack, acked)
+
+        with self.lock:
+            self.stats["batches"] += 1
+            self.stats["failed"] += len(failed)
+
+    def ack(self: Self, keys: List[Tuple[str, int]]) -> NoReturn:
+        """
+        Method to mark messages as acked (delivery acks or read
+        receipts pushed by server), it can be called from any thread
+
+        :params: keys : Chat Id and seq of messages
+        :return: None
+        """
+        self.store.outbox_ack(keys)
+        self.on_ack(keys)
+        with self.lock:
+            self.stats["acked"] += len(keys)
+
+    def summary(self: Self) -> Dict[str, Any]:
+        """
+        Method to return outbox state for tuning (queued, sent
+        batches, acked and failed sends)
+
+        :params: Self
+        :return: Outbox summary
+        """
+        with self.lock:
+            return dict(self.stats)
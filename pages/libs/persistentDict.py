@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import os
+import json
+import tempfile
+import threading
+from typing import NoReturn, Self, Optional, Dict, Set, Any
+
+class PersistentDict(dict):
+    """
+    Dict with write-behind persistence, changed keys are marked
+    dirty and a burst of changes is saved once after a delay (on
+    a timer thread) by writing a temp file and renaming it over
+    the snapshot, only changed keys are saved on top of defaults
+
+    Note: changes inside nested values are not seen, use mark()
+    """
+    def __init__(self: Self,
+                 path: str,
+                 defaults: Optional[Dict[str, Any]] = None,
+                 delay: Optional[float] = 0.5) -> NoReturn:
+
+        super().__init__(defaults or {})
+        self.path: str = path
+        self.delay: float = delay
+        self.lock: threading.RLock = threading.RLock()
+        self.write_lock: threading.Lock = threading.Lock()
+        self.timer: Optional[threading.Timer] = None
+        self.dirty: Set[str] = set()
+        self.writes: int = 0
+
+        # Restore keys saved (or deleted) by earlier sessions
+        self.changed: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                saved: Dict[str, Any] = json.load(file)
+            super().update(saved["values"])
+            for key in saved["deleted"]:
+                super().pop(key, None)
+            self.changed.update(saved["values"], saved["deleted"])
+
+    def __setitem__(self: Self, key: str, value: Any) -> NoReturn:
+        with self.lock:
+            super().__setitem__(key, value)
+            self.mark(key)
+
+    def __delitem__(self: Self, key: str) -> NoReturn:
+        with self.lock:
+            super().__delitem__(key)
+            self.mark(key)
+
+    def update(self: Self, *args: Any, **kwargs: Any) -> NoReturn:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self: Self, key: str, default: Any = None) -> Any:
+        with self.lock:
+            if key not in self:
+                self[key] = default
+            return self[key]
+
+    def pop(self: Self, key: str, *default: Any) -> Any:
+        with self.lock:
+            if key not in self:
+                return super().pop(key, *default)
+            value: Any = super().pop(key)
+            self.mark(key)
+            return value
+
+    def mark(self: Self, key: str) -> NoReturn:
+        """
+        Method to mark a key dirty and schedule a save (saves are
+        debounced, every change restarts the delay)
+
+        :params: key : Changed key
+        :return: None
+        """
+        with self.lock:
+            self.dirty.add(key)
+            self.changed.add(key)
+            if self.timer is not None:
+                self.timer.cancel()
+            # Timer is not a daemon thread, so a pending save still
+            # runs when app exits
+            self.timer = threading.Timer(self.delay, self.flush)
+            self.timer.start()
+
+    def snapshot(self: Self) -> Dict[str, Any]:
+        """
+        Method to return saved part of dict (keys changed or deleted
+        since defaults) and clear dirty keys
+
+        :params: Self
+        :return: Snapshot dict
+        """
+        with self.lock:
+            self.dirty.clear()
+            return {
+                "values": {
+                    key: self[key] for key in self.changed if key in self
+                },
+                "deleted": [key for key in self.changed if key not in self]
+            }
+
+    def flush(self: Self) -> NoReturn:
+        """
+        Method to save dirty keys now (called by the timer, and on
+        exit to save pending changes)
+
+        :params: Self
+        :return: None
+        """
+        # Saves are serialized, so an older snapshot never replaces
+        # a newer one
+        with self.write_lock:
+            with self.lock:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                if not self.dirty:
+                    return None
+                dirty: Set[str] = set(self.dirty)
+                data: str = json.dumps(
+                    self.snapshot(),
+                    ensure_ascii=False,
+                    indent=4
+                )
+
+            # Write temp file next to snapshot and rename it, so a
+            # crash leaves either the old or the new snapshot
+            directory: str = os.path.dirname(os.path.abspath(self.path))
+            descriptor, temp_path = tempfile.mkstemp(
+                dir=directory,
+                prefix=".session-",
+                suffix=".tmp"
+            )
+            try:
+                with os.fdopen(descriptor, "w") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_path, self.path)
+                self.writes += 1
+
+            # Keys are dirty again if saving failed
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                with self.lock:
+                    self.dirty.update(dirty)
+                raise
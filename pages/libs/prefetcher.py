@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import NoReturn, Self, Optional, Hashable, Callable, Dict, Tuple
+
+# 3rd-party Libraries
+import flet as ft
+
+class Prefetcher:
+    """
+    Speculative view builder, builds views of likely next routes
+    on a background thread so navigation can adopt them
+    """
+    def __init__(self: Self,
+                 build: Callable[[str], ft.View],
+                 stamp: Callable[[str], Hashable],
+                 cached: Callable[[str], bool],
+                 workers: Optional[int] = 1) -> NoReturn:
+
+        self.build: Callable[[str], ft.View] = build
+        self.stamp: Callable[[str], Hashable] = stamp
+        self.cached: Callable[[str], bool] = cached
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="prefetch"
+        )
+        self.pending: Dict[str, Tuple[Hashable, Future]] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "late": 0,
+            "misses": 0,
+            "wasted": 0
+        }
+
+    def prefetch(self: Self, *routes: str) -> NoReturn:
+        """
+        Method to start building views of routes in background,
+        cached routes are skipped
+
+        :params: routes : Routes to build
+        :return: None
+        """
+        for route in routes:
+            if not self.cached(route):
+                self.submit(route, self.stamp(route))
+
+    def submit(self: Self, route: str, stamp: Hashable) -> NoReturn:
+        """
+        Method to submit build of a route to background thread
+
+        :params:
+            route : Route to build
+            stamp : State the view is built from, prefetched view
+                    is adopted only if state is same on navigation
+
+        :return: None
+        """
+        with self.lock:
+            # Skip if route is already prefetched with same state
+            if route in self.pending:
+                old_stamp, future = self.pending[route]
+                if old_stamp == stamp:
+                    return None
+                future.cancel()
+                self.stats["wasted"] += 1
+
+            self.pending[route] = (
+                stamp,
+                self.executor.submit(self.build, route)
+            )
+
+    def adopt(self: Self, route: str) -> Optional[ft.View]:
+        """
+        Method to take prefetched view of a route
+
+        :params: route : Requested route
+        :return: Prefetched view or None if it's not prefetched
+        """
+        stamp: Hashable = self.stamp(route)
+        with self.lock:
+            old_stamp, future = self.pending.pop(route, (None, None))
+
+        # Not prefetched or prefetched for another state
+        if future is None or old_stamp != stamp or future.cancelled():
+            if future is not None:
+                future.cancel()
+                self.stats["wasted"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        # Wait for the build if it's still running (failed builds
+        # are built again on navigation)
+        done: bool = future.done()
+        try:
+            view: ft.View = future.result()
+        except Exception:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits" if done else "late"] += 1
+        return view
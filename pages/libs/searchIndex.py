@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import re
+import heapq
+import bisect
+from array import array
+from typing import NoReturn, Self, Optional, Iterable, Iterator, List, Dict, Set, Any
+
+# Word pattern of tokens
+TOKEN: re.Pattern = re.compile(r"\w+")
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Function to split text into lowercase word tokens
+
+    :params: text : Text to split
+    :return: List of tokens
+    """
+    return TOKEN.findall(text.casefold()) if text else []
+
+class Vocabulary:
+    """
+    Terms of many message indexes, every term maps to keys (chat
+    ids) of indexes which have it, so a search over many chats
+    only visits chats which can match
+    """
+    def __init__(self: Self) -> NoReturn:
+        self.postings: Dict[str, Set[str]] = {}
+        self.terms: List[str] = []
+
+    def add(self: Self, term: str, key: str) -> NoReturn:
+        """
+        Method to register a term of an index
+
+        :params:
+            term : New term of index
+            key  : Key of index
+
+        :return: None
+        """
+        keys: Optional[Set[str]] = self.postings.get(term)
+        if keys is None:
+            keys = self.postings[term] = set()
+            bisect.insort(self.terms, term)
+        keys.add(key)
+
+    def find(self: Self,
+             tokens: List[str],
+             max_terms: Optional[int] = 256) -> Optional[Set[str]]:
+        """
+        Method to return keys of indexes which have every query
+        token (last one as a prefix), a short prefix matching more
+        than max_terms terms doesn't narrow keys (merging their keys
+        costs more than searching indexes until enough results)
+
+        :params:
+            tokens    : Query tokens
+            max_terms : Maximum number of terms merged for prefix
+
+        :return: Set of keys (None if keys are not narrowed)
+        """
+        keys: Optional[Set[str]] = None
+        for number, token in enumerate(tokens):
+            if number < len(tokens) - 1:
+                found: Set[str] = self.postings.get(token, set())
+            else:
+                start: int = bisect.bisect_left(self.terms, token)
+                stop: int = bisect.bisect_left(self.terms, token + "\U0010ffff")
+                if stop - start > max_terms:
+                    continue
+                found = set().union(
+                    *(self.postings[term] for term in self.terms[start:stop])
+                )
+            keys = set(found) if keys is None else keys & found
+            if not keys:
+                return set()
+        return keys
+
+class MessageIndex:
+    """
+    Inverted index over message text of a chat, every token maps
+    to seqs of messages which have it (ascending, messages are
+    indexed in order) and tokens are kept sorted for prefix search
+    """
+    def __init__(self: Self,
+                 vocabulary: Optional[Vocabulary] = None,
+                 key: Optional[str] = None) -> NoReturn:
+
+        self.postings: Dict[str, array] = {}
+        self.terms: List[str] = []
+        self.count: int = 0
+
+        # Shared vocabulary which new terms are registered in
+        self.vocabulary: Optional[Vocabulary] = vocabulary
+        self.key: Optional[str] = key
+
+    def add(self: Self, seq: int, text: Optional[str]) -> NoReturn:
+        """
+        Method to index a message
+
+        :params:
+            seq  : Message seq
+            text : Message text (None for system messages)
+
+        :return: None
+        """
+        for token in dict.fromkeys(tokenize(text)):
+            postings: Optional[array] = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array("I")
+                bisect.insort(self.terms, token)
+                if self.vocabulary is not None:
+                    self.vocabulary.add(token, self.key)
+            postings.append(seq)
+        self.count = max(self.count, seq + 1)
+
+    def extend(self: Self, messages: Iterable[Dict[str, Any]]) -> NoReturn:
+        """
+        Method to index messages (dicts with seq)
+
+        :params: messages : Messages to index
+        :return: None
+        """
+        for message in messages:
+            self.add(message["seq"], message.get("message"))
+
+    def matches(self: Self, token: str, prefix: bool) -> List[array]:
+        """
+        Method to return postings of terms matching a token
+
+        :params:
+            token  : Query token
+            prefix : Match terms starting with token
+
+        :return: List of postings
+        """
+        if not prefix:
+            postings: Optional[array] = self.postings.get(token)
+            return [postings] if postings else []
+
+        start: int = bisect.bisect_left(self.terms, token)
+        stop: int = bisect.bisect_left(self.terms, token + "\U0010ffff")
+        return [self.postings[term] for term in self.terms[start:stop]]
+
+    def search(self: Self, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Method to find messages matching a query, every word of
+        query must match a token and last word may be a prefix
+        (query is being typed)
+
+        :params:
+            query : Search query
+            limit : Maximum number of results (None for all)
+
+        :return: List of seqs (newest first)
+        """
+        return self.find(tokenize(query), limit)
+
+    def find(self: Self, tokens: List[str], limit: Optional[int] = None) -> List[int]:
+        """
+        Method to find messages matching query tokens (used when
+        same query is searched in many indexes)
+
+        :params:
+            tokens : Query tokens (last one may be a prefix)
+            limit  : Maximum number of results (None for all)
+
+        :return: List of seqs (newest first)
+        """
+        words: List[List[array]] = [
+            self.matches(token, prefix=number == len(tokens) - 1)
+            for number, token in enumerate(tokens)
+        ]
+        if not words or not all(words):
+            return []
+
+        # Walk the rarest word's messages from newest, keep the ones
+        # which have other words too and stop at limit
+        words.sort(key=lambda postings: sum(map(len, postings)))
+        rarest: List[array] = words.pop(0)
+        seqs: Iterator[int] = reversed(rarest[0]) if len(rarest) == 1 else heapq.merge(
+            *map(reversed, rarest),
+            reverse=True
+        )
+        results: List[int] = []
+        last: Optional[int] = None
+        for seq in seqs:
+            if seq == last:
+                continue
+            last = seq
+            for word in words:
+                for postings in word:
+                    if contains(postings, seq):
+                        break
+                else:
+                    break
+            else:
+                results.append(seq)
+                if len(results) == limit:
+                    break
+        return results
+
+def contains(postings: array, seq: int) -> bool:
+    """
+    Function to check if sorted postings have a seq
+
+    :params:
+        postings : Sorted seqs
+        seq      : Seq to find
+
+    :return: True if seq is in postings
+    """
+    position: int = bisect.bisect_left(postings, seq)
+    return position < len(postings) and postings[position] == seq
+
+class ChatIndex:
+    """
+    Prefix index over chat names and usernames, every term maps to
+    positions of chats which have it (chats keep their list order)
+    """
+    def __init__(self: Self, chats: Iterable[Dict[str, Any]]) -> NoReturn:
+        self.chats: List[Dict[str, Any]] = list(chats)
+        self.postings: Dict[str, List[int]] = {}
+
+        # Names as tokens, to rank chats whose name starts with query
+        self.names: List[str] = [
+            " ".join(tokenize(chat.get("name"))) for chat in self.chats
+        ]
+        for position, chat in enumerate(self.chats):
+            text: str = f"{chat.get("name") or ""} {chat.get("username") or ""}"
+            for token in dict.fromkeys(tokenize(text)):
+                self.postings.setdefault(token, []).append(position)
+        self.terms: List[str] = sorted(self.postings)
+
+    def prefixed(self: Self, prefix: str) -> Set[int]:
+        """
+        Method to return positions of chats with a term starting
+        with prefix
+
+        :params: prefix : Term prefix
+        :return: Set of chat positions
+        """
+        start: int = bisect.bisect_left(self.terms, prefix)
+        stop: int = bisect.bisect_left(self.terms, prefix + "\U0010ffff")
+        positions: Set[int] = set()
+        for term in self.terms[start:stop]:
+            positions.update(self.postings[term])
+        return positions
+
+    def search(self: Self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Method to find chats which have every word of query as a
+        prefix of their name or username, chats whose name starts
+        with the query come first, then chats keep list order
+
+        :params:
+            query : Search query
+            limit : Maximum number of results (None for all)
+
+        :return: List of chats
+        """
+        tokens: List[str] = tokenize(query)
+        if not tokens:
+            return []
+
+        positions: Set[int] = self.prefixed(tokens[0])
+        for token in tokens[1:]:
+            if not positions:
+                break
+            positions &= self.prefixed(token)
+
+        text: str = " ".join(tokens)
+        return [
+            self.chats[position] for position in sorted(
+                positions,
+                key=lambda position: (
+                    not self.names[position].startswith(text),
+                    position
+                )
+            )
+        ][:limit]
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import os
+import sys
+import json
+import marshal
+import tempfile
+from typing import Sequence, Dict, Tuple, Any
+
+# Local Libraries
+from pages.libs.assetCache import AssetCache, assets
+
+# JSON files parsed on startup (and by first layouts)
+STARTUP_ASSETS: Tuple[str, ...] = (
+    "./data/self.json",
+    "./data/countries.json"
+)
+
+# Marshal format depends on Python version, snapshots of other
+# versions are made again
+FORMAT: Tuple[int, str] = (marshal.version, sys.implementation.cache_tag)
+
+def load_snapshot(path: str,
+                  sources: Sequence[str] = STARTUP_ASSETS,
+                  cache: AssetCache = assets) -> bool:
+    """
+    Function to load parsed startup assets from a marshal snapshot
+    into asset cache, snapshot is made again if any source JSON
+    is changed (by mtime and size)
+
+    :params:
+        path    : Snapshot path
+        sources : JSON files in snapshot
+        cache   : Asset cache to fill
+
+    :return: True if snapshot was up to date
+    """
+    signatures: Dict[str, Tuple[int, int]] = {
+        source: AssetCache.signature(source) for source in sources
+    }
+
+    # Read snapshot, any broken or outdated snapshot is made again
+    # (it's read at once, marshal.load reads files in small pieces)
+    snapshot: Dict[str, Any] = {}
+    try:
+        with open(path, "rb") as file:
+            snapshot = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    fresh: bool = (
+        isinstance(snapshot, dict)
+        and snapshot.get("format") == FORMAT
+        and snapshot.get("signatures") == signatures
+    )
+
+    if not fresh:
+        snapshot = {
+            "format": FORMAT,
+            "signatures": signatures,
+            "assets": {}
+        }
+        for source in sources:
+            with open(source, "r", encoding="utf-8") as file:
+                snapshot["assets"][source] = json.load(file)
+        save_snapshot(path, snapshot)
+
+    for source in sources:
+        cache.prime(
+            path=source,
+            signature=signatures[source],
+            data=snapshot["assets"][source]
+        )
+    return fresh
+
+def save_snapshot(path: str, snapshot: Dict[str, Any]) -> None:
+    """
+    Function to write snapshot (temp file and rename, so a crash
+    never leaves a half written snapshot)
+
+    :params:
+        path     : Snapshot path
+        snapshot : Snapshot data
+
+    :return: None
+    """
+    descriptor, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=".snapshot-",
+        suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(marshal.dumps(snapshot))
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import random
+import asyncio
+from abc import ABC, abstractmethod
+from typing import NoReturn, Self, Optional, Tuple, List, Dict, Any
+
+class Transport(ABC):
+    """
+    Transport of outbox, sends a batch of messages to server and
+    returns the ones server has acked (raises if server can't be
+    reached, the batch is retried)
+    """
+    @abstractmethod
+    async def send(self: Self,
+                   messages: List[Dict[str, Any]]) -> List[Tuple[str, int]]:
+        """
+        Method to send a batch of messages
+
+        :params: messages : Messages (chat_id, seq, message and time)
+        :return: Chat Id and seq of acked messages
+        """
+
+
+class LocalTransport(Transport):
+    """
+    Local stand-in of server (there is no backend yet), acks
+    messages after a delay and fails like a network would
+    """
+    def __init__(self: Self,
+                 latency: Optional[float] = 0.3,
+                 failure_rate: Optional[float] = 0.0,
+                 online: Optional[bool] = True) -> NoReturn:
+
+        self.latency: float = latency
+        self.failure_rate: float = failure_rate
+        self.online: bool = online
+        self.received: List[Dict[str, Any]] = []
+
+    async def send(self: Self,
+                   messages: List[Dict[str, Any]]) -> List[Tuple[str, int]]:
+        """
+        Method to send a batch of messages to local server
+
+        :params: messages : Messages (chat_id, seq, message and time)
+        :return: Chat Id and seq of acked messages
+        """
+        await asyncio.sleep(self.latency)
+        if not self.online or random.random() < self.failure_rate:
+            raise ConnectionError("server is not reachable")
+        self.received += messages
+        return [(message["chat_id"], message["seq"]) for message in messages]
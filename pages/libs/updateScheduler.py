@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import time
+import threading
+from contextlib import contextmanager
+from typing import NoReturn, Self, Optional, Iterator, List, Dict, Any
+
+# 3rd-party Libraries
+import flet as ft
+
+class UpdateScheduler:
+    """
+    Scheduler of control updates, handlers mark changed controls
+    dirty and they are sent to client together once per frame (or
+    at the end of a batch), so a burst of updates is one round trip
+    """
+    def __init__(self: Self,
+                 page: ft.Page,
+                 interval: Optional[float] = 0.016) -> NoReturn:
+
+        self.page: ft.Page = page
+        self.interval: float = interval
+        self.lock: threading.Lock = threading.Lock()
+        self.local: threading.local = threading.local()
+        self.timer: Optional[threading.Timer] = None
+        self.dirty: Dict[int, ft.Control] = {}
+
+        # Held across page.update(), so a flush waits for the one
+        # which is being sent
+        self.flush_lock: threading.RLock = threading.RLock()
+        self.stats: Dict[str, float] = {
+            "marks": 0,
+            "flushes": 0,
+            "controls": 0,
+            "flush_ms": 0.0,
+            "max_flush_ms": 0.0
+        }
+
+    def mark(self: Self, *controls: ft.Control) -> NoReturn:
+        """
+        Method to mark controls dirty, they are updated on next
+        frame (or when current batch ends)
+
+        :params: controls : Changed controls
+        :return: None
+        """
+        with self.lock:
+            self.stats["marks"] += len(controls)
+
+        # Marks of a batch are kept by it's thread and only that
+        # batch flushes them
+        if getattr(self.local, "depth", 0):
+            for control in controls:
+                self.local.dirty[id(control)] = control
+            return None
+
+        # Others wait for a frame
+        with self.lock:
+            for control in controls:
+                self.dirty[id(control)] = control
+            if self.timer is not None:
+                return None
+            self.timer = threading.Timer(self.interval, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    @contextmanager
+    def batch(self: Self) -> Iterator[Self]:
+        """
+        Context manager to flush controls marked inside it when it
+        ends (use it around handlers which need the update to be
+        sent before they return, and around changes of controls
+        made off handler threads)
+
+        :params: Self
+        :return: Scheduler
+        """
+        if not getattr(self.local, "depth", 0):
+            self.local.depth = 0
+            self.local.dirty = {}
+        self.local.depth += 1
+        try:
+            yield self
+        finally:
+            self.local.depth -= 1
+            if not self.local.depth:
+                controls: List[ft.Control] = list(self.local.dirty.values())
+                self.local.dirty = {}
+                self.send(controls)
+
+    def flush(self: Self) -> NoReturn:
+        """
+        Method to send updates of controls marked outside batches
+        (called by frame timer)
+
+        :params: Self
+        :return: None
+        """
+        with self.flush_lock:
+            with self.lock:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                controls: List[ft.Control] = list(self.dirty.values())
+                self.dirty.clear()
+            self.send(controls)
+
+    def send(self: Self, controls: List[ft.Control]) -> NoReturn:
+        """
+        Method to send updates of controls in one round trip, it
+        waits for a flush which is being sent and controls which
+        are not on page anymore are skipped
+
+        :params: controls : Controls to update
+        :return: None
+        """
+        with self.flush_lock:
+            controls = [control for control in controls if control.page is not None]
+            if not controls:
+                return None
+
+            start: float = time.perf_counter()
+            self.page.update(*controls)
+            elapsed: float = (time.perf_counter() - start) * 1000
+        with self.lock:
+            self.stats["flushes"] += 1
+            self.stats["controls"] += len(controls)
+            self.stats["flush_ms"] += elapsed
+            self.stats["max_flush_ms"] = max(self.stats["max_flush_ms"], elapsed)
+
+    def summary(self: Self) -> Dict[str, Any]:
+        """
+        Method to return scheduler state for tuning (marks, flushes,
+        controls per flush and flush latency)
+
+        :params: Self
+        :return: Scheduler summary
+        """
+        with self.lock:
+            flushes: int = self.stats["flushes"]
+            return {
+                "marks": self.stats["marks"],
+                "flushes": flushes,
+                "controls_per_flush": self.stats["controls"] / flushes if flushes else 0.0,
+                "mean_flush_ms": self.stats["flush_ms"] / flushes if flushes else 0.0,
+                "max_flush_ms": self.stats["max_flush_ms"]
+            }
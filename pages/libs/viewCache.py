@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard Libraries
+import threading
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+from typing import NoReturn, Self, Optional, Hashable, Callable, Tuple, List
+
+# 3rd-party Libraries
+import flet as ft
+
+class ViewCache:
+    """
+    Bounded LRU cache for built views, keyed on route plus
+    the state the view was built from (e.g. chat id)
+    """
+    def __init__(self: Self, capacity: Optional[int] = 8) -> NoReturn:
+        self.capacity: int = capacity
+        self.views: OrderedDict[Tuple[str, Hashable], ft.View] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+        self.offsets: WeakKeyDictionary[ft.ListView, float] = WeakKeyDictionary()
+
+    def get(self: Self, route: str, key: Hashable) -> Optional[ft.View]:
+        """
+        Method to return cached view and mark it as recently used
+
+        :params:
+            route : View route
+            key   : State key of the view
+
+        :return: Cached view or None
+        """
+        with self.lock:
+            view: Optional[ft.View] = self.views.get((route, key))
+            if view is not None:
+                self.views.move_to_end((route, key))
+            return view
+
+    def has(self: Self, route: str, key: Hashable) -> bool:
+        """
+        Method to check if a view is cached (without marking it
+        as recently used)
+
+        :params:
+            route : View route
+            key   : State key of the view
+
+        :return: True if view is cached
+        """
+        with self.lock:
+            return (route, key) in self.views
+
+    def put(self: Self, route: str, key: Hashable, view: ft.View) -> NoReturn:
+        """
+        Method to cache a view, least recently used view will be
+        dropped if cache is full
+
+        :params:
+            route : View route
+            key   : State key of the view
+            view  : Built view
+
+        :return: None
+        """
+        with self.lock:
+            self.views[(route, key)] = view
+            self.views.move_to_end((route, key))
+            while len(self.views) > self.capacity:
+                self.views.popitem(last=False)
+
+    def invalidate(self: Self,
+                   route: Optional[str] = None,
+                   key: Optional[Hashable] = None) -> NoReturn:
+        """
+        Method to drop cached views, call it when state behind
+        a view changes
+
+        :params:
+            route : Route to drop (all routes if None)
+            key   : State key to drop (all keys of route if None)
+
+        :return: None
+        """
+        with self.lock:
+            targets: List[Tuple[str, Hashable]] = [
+                cached for cached in self.views
+                if (route is None or cached[0] == route)
+                and (key is None or cached[1] == key)
+            ]
+            for cached in targets:
+                del self.views[cached]
+
+    def track_scroll(self: Self, view: ft.View) -> NoReturn:
+        """
+        Method to keep scroll position of view's scroll views, so
+        they can be restored when the view is shown again (their
+        own scroll handlers are still called)
+
+        :params: view : Built view
+        :return: None
+        """
+        def save_offset(handler: Optional[Callable[[ft.OnScrollEvent], None]]) -> Callable[[ft.OnScrollEvent], None]:
+            """
+            Inner helper function to return scroll handler which
+            saves scroll offset
+
+            :params: handler : Scroll handler of scroll view
+            :return: Scroll handler
+            """
+            def on_scroll(e: ft.OnScrollEvent) -> NoReturn:
+                self.offsets[e.control] = e.pixels
+                if handler is not None:
+                    handler(e)
+            return on_scroll
+
+        for control in view.controls:
+            if isinstance(control, ft.ListView):
+                self.offsets[control] = 0
+                control.on_scroll_interval = 100
+                control.on_scroll = save_offset(control.on_scroll)
+
+    def forget_scroll(self: Self, control: ft.ListView) -> NoReturn:
+        """
+        Method to drop saved scroll offset of a scroll view (when
+        it's scrolled by page itself)
+
+        :params: control : Scroll view
+        :return: None
+        """
+        self.offsets.pop(control, None)
+
+    def restore_scroll(self: Self, view: ft.View) -> NoReturn:
+        """
+        Method to scroll view's scroll views back to saved offset
+
+        :params: view : Shown view
+        :return: None
+        """
+        for control in view.controls:
+            if isinstance(control, ft.ListView) and self.offsets.get(control):
+                control.scroll_to(
+                    offset=self.offsets[control],
+                    duration=0
+                )
@@ -5,7 +5,6 @@
 
 # Standard Libraries
 import time
-import json
 from typing import Any, List, Dict, NoReturn
 
 # 3rd-party Libraries
@@ -14,6 +13,7 @@ from flet_core.event_handler import ControlEvent
 
 # Local Libraries
 from pages.libs.loginControls import DialButton
+from pages.libs.assetCache import load_json
 
 def login_layout(page: ft.Page) -> List[Any]:
     """
@@ -38,7 +38,7 @@ def login_layout(page: ft.Page) -> List[Any]:
             height=25,
             width=25
         )
-        e.control.update()
+        page.scheduler.mark(e.control)
 
         # Register phone number in database
         page.database["phone_number"] = phone_input.value
@@ -47,6 +47,17 @@ def login_layout(page: ft.Page) -> List[Any]:
         time.sleep(1)
         page.go("/otpauth")
 
+    def phone_changed() -> NoReturn:
+        """
+        Helper function to register typed phone number and
+        prefetch OTP page for it while user is typing
+
+        :params: None
+        :return: None
+        """
+        page.database["phone_number"] = phone_input.value
+        page.prefetcher.prefetch("/otpauth")
+
     def select_country(name: str, code: str, flag_icon: str) -> NoReturn:
         """
         Helper function to update country list based on
@@ -59,20 +70,22 @@ def login_layout(page: ft.Page) -> List[Any]:
         
         :return: None
         """
-        # Change the country name
-        country_name.value = name
-        # Change the phone number input and focus it
-        phone_input.value = code
-        phone_input.focus()
+        # Update controls in one round trip
+        with page.scheduler.batch():
+            # Change the country name
+            country_name.value = name
+            # Change the phone number input and focus it
+            phone_input.value = code
+            phone_input.focus()
+
+            # Change the flag input and it's size
+            country_flag.value = flag_icon
+            country_flag.size = 20
 
-        # Change the flag input and it's size
-        country_flag.value = flag_icon
-        country_flag.size = 20
+            # Mark controls for update
+            page.scheduler.mark(country_flag, country_name, phone_input)
 
-        # Update control and close bottom sheet
-        country_flag.update()
-        country_name.update()
-        phone_input.update()
+        # Close bottom sheet
         page.close(country_bottom_sheet)
 
     def open_bottom_sheet() -> NoReturn:
@@ -113,12 +126,11 @@ def login_layout(page: ft.Page) -> List[Any]:
                         )
                     )
                 )
-            # Update the bottom sheet
-            country_bottom_sheet.update()
+            # Mark the bottom sheet for update
+            page.scheduler.mark(country_bottom_sheet)
 
-    # Load County database
-    with open("./data/countries.json", "r") as data:
-        countries: List[Dict[str, str]] = json.load(data)
+    # Load County database (parsed once and shared)
+    countries: List[Dict[str, str]] = load_json("./data/countries.json")
 
     # Initialize a bottom sheet for country selection
     country_bottom_sheet: ft.BottomSheet = ft.BottomSheet(
@@ -312,19 +324,22 @@ def login_layout(page: ft.Page) -> List[Any]:
                                 number="1", 
                                 text=None, 
                                 page=page, 
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton(
                                 number="2", 
                                 text="ABC",
                                 page=page, 
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton(
                                 number="3", 
                                 text="DEF",
                                 page=page, 
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build()
                         ]
                     ),
@@ -336,19 +351,22 @@ def login_layout(page: ft.Page) -> List[Any]:
                                 number="4", 
                                 text="GHI",
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton(
                                 number="5", 
                                 text="JKL",
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton(
                                 number="6", 
                                 text="MNO",
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                         ]
                     ),
@@ -360,19 +378,22 @@ def login_layout(page: ft.Page) -> List[Any]:
                                 number="7", 
                                 text="PQRS",
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton(
                                 number="8", 
                                 text="TUV",
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton(
                                 number="9", 
                                 text="WXYZ",
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                         ]
                     ),
@@ -385,12 +406,14 @@ def login_layout(page: ft.Page) -> List[Any]:
                                 number="0", 
                                 text="+",
                                 page=page, 
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ).build(),
                             DialButton.icon_only(
                                 icon_name="backspace_outlined", 
                                 page=page,
-                                phone_input=phone_input
+                                phone_input=phone_input,
+                                on_change=phone_changed
                             ),
                         ]
                     )
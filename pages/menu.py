@@ -5,7 +5,6 @@
 
 # Standard Libraries
 import random
-import json
 from typing import List, Dict, Any
 
 # 3rd-party Libraries
@@ -56,7 +55,8 @@ def menu_layout(page: ft.Page) -> List[Any]:
                         name="search", 
                         size=25, 
                         color="#ffffff"
-                    )
+                    ),
+                    on_click=lambda _: page.go("/search")
                 )
             ]
         ),
@@ -130,26 +130,27 @@ def menu_layout(page: ft.Page) -> List[Any]:
             )
         )
 
-    # Load chat dialogs from database
-    with open("./data/chats.json", "r") as file:
-        chats: List[Dict[str, Any]] = json.load(file)
+    # Load chat dialogs from chat registry and their summaries (last
+    # message and unread count) from message store
+    chats: List[Dict[str, Any]] = page.chat_registry.chats
+    summaries: Dict[str, Dict[str, Any]] = page.message_store.summaries()
 
     # Add chat dialogs to it's chat folder
     for chat_folder in chat_dialogs.tabs:
         for chat in chats:
-            # Get chat details from chat messages
-            try:
-                with open(f"./data/messages/{chat["id"]}.json") as file:
-                    temp_data: Dict[str, str] = json.load(file)[-1]
-                    last_mesg: str = temp_data["message"]
-                    last_role: str = temp_data["role"]
-                    last_time: str = temp_data["time"]
+            # Get chat details from chat summary
+            if (temp_data := summaries.get(chat["id"])):
+                last_mesg: str = temp_data.get("message", "")
+                last_role: str = temp_data["role"]
+                last_time: str = temp_data["time"]
+                last_count: int = temp_data["unread"]
             
             # Leave history empty
-            except FileNotFoundError:
+            else:
                 last_mesg: str = "Chat history deleted"
                 last_role: str = "empty"
                 last_time: str = ""
+                last_count: int = 0
                   
             if chat["folder"] == chat_folder.text:
                 chat_folder.content.content.controls.append(
@@ -159,17 +160,11 @@ def menu_layout(page: ft.Page) -> List[Any]:
                         message=last_mesg,
                         time=last_time,
                         seen=True if last_role == "self" else True if last_role == "empty" else False,
-                        count=0 if last_role == "empty" else chat["count"],
+                        count=last_count,
                         pinned=chat["pinned"],
                         muted=chat["muted"],
                         chat_id=chat["id"],
-                        phone_number=chat["phone_number"],
-                        username=chat["username"],
-                        birth=chat["birth"],
-                        status=chat["status"],
-                        bio=chat["bio"],
                         has_story=chat["has_story"],
-                        channel=chat["channel"],
                         story_seen=chat["story_seen"],
                         page=page
                     ).build()
@@ -5,7 +5,6 @@
 
 # Standard Libraries
 import random
-import json
 from typing import NoReturn, List, Dict, Any
 
 # 3rd-party Libraries
@@ -14,12 +13,16 @@ import flet as ft
 # Local Libraries
 from pages.libs.pfp import ProfilePicture
 from pages.libs.message import Message
+from pages.libs.assetCache import load_json
 
-def profile_layout(page: ft.Page) -> List[Any]:
+def profile_layout(page: ft.Page, chat_id: str) -> List[Any]:
     """
-    layout function for menu page
+    layout function for profile page
+
+    :params:
+        page    : page layout
+        chat_id : Id of the chat
 
-    :params: page : page layout
     :return: list of controls
     """
 
@@ -30,9 +33,10 @@ def profile_layout(page: ft.Page) -> List[Any]:
         :params: None
         :return: Random palette
         """
-        # Open palettes database
-        with open("./data/profile_palette.json", "r") as file:
-            palettes: Dict[str, List[Dict[str, str]]] = json.load(file)
+        # Load palettes database (parsed once and shared)
+        palettes: Dict[str, List[Dict[str, str]]] = load_json(
+            "./data/profile_palette.json"
+        )
 
         # Return random palette
         return random.choice(
@@ -41,7 +45,7 @@ def profile_layout(page: ft.Page) -> List[Any]:
 
     # Initialize the palette and database
     palette: Dict[str, str] = random_scheme()
-    db: Dict[str, Any] = page.database["chat"]
+    db: Dict[str, Any] = page.chat_registry.resolve(chat_id)
 
     # Profile menu controls
     profile_controls = [
@@ -139,7 +143,7 @@ def profile_layout(page: ft.Page) -> List[Any]:
                         bgcolor=palette["button"],
                         shadow_color="#000000"    
                     ),
-                    on_click=lambda _:page.go("/chat")
+                    on_click=lambda _:page.go(f"/chat/{chat_id}")
                 ),
                 # Channel info row if user has channel else nothing
                 ft.Row(
@@ -162,7 +166,7 @@ def profile_layout(page: ft.Page) -> List[Any]:
                             )
                         ),
                     ]
-                ) if page.database["chat"]["channel"] else ft.Text(
+                ) if db["channel"] else ft.Text(
                     value="", 
                     height=0
                 ),
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Search page
+
+# Standard Libraries
+from typing import Any, List, Dict, NoReturn
+
+# 3rd-party Libraries
+import flet as ft
+
+# Local Libraries
+from pages.libs.pfp import ProfilePicture
+from pages.libs.messageRecord import MessageRecord
+
+def search_layout(page: ft.Page) -> List[Any]:
+    """
+    layout function for search page
+
+    :params: page : page layout
+    :return: list of controls
+    """
+
+    def open_message(chat_id: str, seq: int) -> NoReturn:
+        """
+        Helper function to open chat and scroll to a message (jump
+        is set on chat view before navigation, since route change
+        shows the view in background)
+
+        :params:
+            chat_id : Chat Id
+            seq     : Message seq
+
+        :return: None
+        """
+        route: str = f"/chat/{chat_id}"
+        view: ft.View = page.get_view(route)
+        for control in view.controls:
+            if isinstance(control, ft.ListView):
+                control.data.show(seq)
+        page.go(route)
+
+    def header(text: str) -> ft.Container:
+        """
+        Helper function to return header of a result section
+
+        :params: text : Header text
+        :return: Header control
+        """
+        return ft.Container(
+            bgcolor="#243140",
+            padding=ft.padding.symmetric(vertical=5, horizontal=15),
+            content=ft.Text(
+                value=text,
+                color="#52b4ff",
+                weight="bold"
+            )
+        )
+
+    def chat_result(chat: Dict[str, Any]) -> ft.ListTile:
+        """
+        Helper function to return a found chat
+
+        :params: chat : Chat
+        :return: Chat result control
+        """
+        return ft.ListTile(
+            leading=ProfilePicture(
+                profile=chat["profile"],
+                has_story=False,
+                size=45,
+                name=chat["name"]
+            ).build(),
+            title=ft.Text(
+                value=chat["name"],
+                size=18
+            ),
+            subtitle=ft.Text(
+                value=f"@{chat["username"]}" if chat.get("username") else "",
+                color="#888e94"
+            ),
+            on_click=lambda _: page.go(f"/chat/{chat["id"]}")
+        )
+
+    def message_result(chat: Dict[str, Any], seq: int) -> ft.ListTile:
+        """
+        Helper function to return a found message
+
+        :params:
+            chat : Chat of message
+            seq  : Message seq
+
+        :return: Message result control
+        """
+        message: MessageRecord = page.message_store.messages_before(
+            chat_id=chat["id"],
+            seq=seq + 1,
+            limit=1
+        )[0]
+        return ft.ListTile(
+            leading=ProfilePicture(
+                profile=chat["profile"],
+                has_story=False,
+                size=45,
+                name=chat["name"]
+            ).build(),
+            title=ft.Row(
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                controls=[
+                    ft.Text(
+                        value=chat["name"],
+                        size=18
+                    ),
+                    ft.Text(
+                        value=message.time,
+                        color="#888e94"
+                    )
+                ]
+            ),
+            subtitle=ft.Text(
+                value=message.message,
+                color="#888e94",
+                max_lines=1,
+                overflow=ft.TextOverflow.ELLIPSIS
+            ),
+            on_click=lambda _: open_message(chat["id"], seq)
+        )
+
+    def show_results(results: Dict[str, Any]) -> NoReturn:
+        """
+        Helper function to show results of a query, called from
+        search thread as results are found (results of old queries
+        are dropped)
+
+        :params: results : Query results
+        :return: None
+        """
+        nonlocal shown
+        if page.global_search.stale(results["generation"]):
+            return None
+
+        # Build new rows first, chats are sent first and messages
+        # are added as they are found
+        fresh: bool = not results["messages"]
+        rows: List[ft.Control] = []
+        if fresh and results["chats"]:
+            rows.append(header("Chats"))
+            rows.extend(chat_result(chat) for chat in results["chats"])
+        if results["messages"] and not shown:
+            rows.append(header("Messages"))
+        rows.extend(
+            message_result(found["chat"], found["seq"])
+            for found in results["messages"][shown:]
+        )
+
+        # Change the list and send it on this thread (frame flush
+        # must not diff it while it's being changed)
+        with page.scheduler.batch():
+            if fresh:
+                result_list.controls.clear()
+            result_list.controls.extend(rows)
+            shown = len(results["messages"])
+
+            # Tell if nothing is found
+            if results["done"] and results["query"].strip() and not result_list.controls:
+                result_list.controls.append(
+                    ft.Container(
+                        padding=20,
+                        alignment=ft.alignment.Alignment(0, 0),
+                        content=ft.Text(
+                            value="No results",
+                            color="#888e94"
+                        )
+                    )
+                )
+            page.scheduler.mark(result_list)
+
+    def query_changed() -> NoReturn:
+        """
+        Helper function to start search when query changes
+
+        :params: None
+        :return: None
+        """
+        page.global_search.search(
+            query=search_input.value,
+            on_results=show_results
+        )
+
+    # Number of shown messages of latest query
+    shown: int = 0
+
+    # Build message indexes while user types
+    page.global_search.warm()
+
+    # Return page controls
+    return [
+        # App bar
+        ft.AppBar(
+            center_title=False,
+            bgcolor="#243140",
+            leading=ft.IconButton(
+                icon="arrow_back",
+                icon_size=25,
+                icon_color="#ffffff",
+                on_click=lambda _: page.go("/menu")
+            ),
+            title=(
+                search_input := ft.TextField(
+                    autofocus=True,
+                    text_size=20,
+                    hint_text="Search",
+                    border=ft.InputBorder.NONE,
+                    on_change=lambda _: query_changed()
+                )
+            )
+        ),
+        # Search results
+        result_list := ft.ListView(
+            expand=True,
+            spacing=0,
+            padding=0,
+            controls=[]
+        )
+    ]
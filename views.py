@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 # Standard Libraries
-from typing import NoReturn, Dict
+from typing import NoReturn, Dict, Callable, Hashable, Optional, List, Tuple
 
 # 3rd-Party Libraries
 import flet as ft
@@ -13,58 +13,337 @@ from pages.otpauth import otpauth_layout
 from pages.menu import menu_layout
 from pages.chat import chat_layout
 from pages.profile import profile_layout
+from pages.search import search_layout
 
-def view_handler(page: ft.Page) -> Dict[str, ft.View]:
+def login_view(page: ft.Page) -> ft.View:
     """
-    Function to return views map
+    Function to build login view
 
     :params: page = Flet Page Layout
-    :return: Views map
-    """
-    return {
-        "/login": ft.View(
-            padding=0,
-            spacing=0,
-            route="/login",
-            controls=login_layout(page),
-            vertical_alignment=ft.MainAxisAlignment.CENTER,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            bgcolor="#1a2631"
-        ),
-        "/otpauth": ft.View(
-            padding=0,
-            spacing=0,
-            route="/otpauth",
-            controls=otpauth_layout(page),
-            vertical_alignment=ft.MainAxisAlignment.CENTER,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            bgcolor="#1a2631"
-        ),
-        "/menu": ft.View(
-            padding=0,
-            spacing=0,
-            route="/menu",
-            controls=menu_layout(page),
-            vertical_alignment=ft.MainAxisAlignment.CENTER,
-            horizontal_alignment=ft.CrossAxisAlignment.START,
-            bgcolor="#1a2631"
-        ),
-        "/chat": ft.View(
-            padding=0,
-            spacing=0,
-            route="/chat",
-            controls=chat_layout(page),
-            vertical_alignment=ft.MainAxisAlignment.START,
-            horizontal_alignment=ft.CrossAxisAlignment.START,
-            bgcolor="#1a2631"
-        ),
-        "/profile": ft.View(
-            padding=0,
-            spacing=0,
-            route="/profile",
-            controls=profile_layout(page),
-            vertical_alignment=ft.MainAxisAlignment.START,
-            horizontal_alignment=ft.CrossAxisAlignment.START,
-            bgcolor="#1a2631"
+    :return: Login view
+    """
+    return ft.View(
+        padding=0,
+        spacing=0,
+        route="/login",
+        controls=login_layout(page),
+        vertical_alignment=ft.MainAxisAlignment.CENTER,
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        bgcolor="#1a2631"
+    )
+
+def otpauth_view(page: ft.Page) -> ft.View:
+    """
+    Function to build otpauth view
+
+    :params: page = Flet Page Layout
+    :return: OTPAuth view
+    """
+    return ft.View(
+        padding=0,
+        spacing=0,
+        route="/otpauth",
+        controls=otpauth_layout(page),
+        vertical_alignment=ft.MainAxisAlignment.CENTER,
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        bgcolor="#1a2631"
+    )
+
+def menu_view(page: ft.Page) -> ft.View:
+    """
+    Function to build menu view
+
+    :params: page = Flet Page Layout
+    :return: Menu view
+    """
+    return ft.View(
+        padding=0,
+        spacing=0,
+        route="/menu",
+        controls=menu_layout(page),
+        vertical_alignment=ft.MainAxisAlignment.CENTER,
+        horizontal_alignment=ft.CrossAxisAlignment.START,
+        bgcolor="#1a2631"
+    )
+
+def chat_view(page: ft.Page, chat_id: str) -> ft.View:
+    """
+    Function to build chat view
+
+    :params:
+        page    = Flet Page Layout
+        chat_id = Chat Id
+
+    :return: Chat view
+    """
+    return ft.View(
+        padding=0,
+        spacing=0,
+        route=f"/chat/{chat_id}",
+        controls=chat_layout(page, chat_id),
+        vertical_alignment=ft.MainAxisAlignment.START,
+        horizontal_alignment=ft.CrossAxisAlignment.START,
+        bgcolor="#1a2631"
+    )
+
+def profile_view(page: ft.Page, chat_id: str) -> ft.View:
+    """
+    Function to build profile view
+
+    :params:
+        page    = Flet Page Layout
+        chat_id = Chat Id
+
+    :return: Profile view
+    """
+    return ft.View(
+        padding=0,
+        spacing=0,
+        route=f"/profile/{chat_id}",
+        controls=profile_layout(page, chat_id),
+        vertical_alignment=ft.MainAxisAlignment.START,
+        horizontal_alignment=ft.CrossAxisAlignment.START,
+        bgcolor="#1a2631"
+    )
+
+def search_view(page: ft.Page) -> ft.View:
+    """
+    Function to build search view
+
+    :params: page = Flet Page Layout
+    :return: Search view
+    """
+    return ft.View(
+        padding=0,
+        spacing=0,
+        route="/search",
+        controls=search_layout(page),
+        vertical_alignment=ft.MainAxisAlignment.START,
+        horizontal_alignment=ft.CrossAxisAlignment.START,
+        bgcolor="#1a2631"
+    )
+
+# Routes map (route template -> view builder), views are built
+# only when their route is requested
+ROUTES: Dict[str, Callable[..., ft.View]] = {
+    "/login": login_view,
+    "/otpauth": otpauth_view,
+    "/menu": menu_view,
+    "/chat/:chat_id": chat_view,
+    "/profile/:chat_id": profile_view,
+    "/search": search_view
+}
+
+# Cache keys map (route template -> state the view is built from),
+# routes which are not in this map (login, otpauth, search) hold
+# input state and are always rebuilt
+CACHE_KEYS: Dict[str, Callable[[Dict[str, str]], Hashable]] = {
+    "/menu": lambda params: None,
+    "/chat/:chat_id": lambda params: params["chat_id"],
+    "/profile/:chat_id": lambda params: params["chat_id"]
+}
+
+# Parents map (route template -> route of the view under it in
+# views stack), routes which are not in this map are root views
+PARENTS: Dict[str, Callable[[ft.Page, Dict[str, str]], str]] = {
+    "/chat/:chat_id": lambda page, params: "/menu",
+    "/profile/:chat_id": lambda page, params: (
+        page.database["last_page"] or "/menu"
+    ),
+    "/search": lambda page, params: "/menu"
+}
+
+# Prefetch stamps map (route template -> state of page a view is
+# built from), prefetched views are adopted only if state is same
+STAMPS: Dict[str, Callable[[ft.Page, Dict[str, str]], Hashable]] = {
+    "/otpauth": lambda page, params: page.database["phone_number"],
+    "/chat/:chat_id": lambda page, params: page.message_store.count(
+        params["chat_id"]
+    )
+}
+
+# Next routes map (route template -> routes which are likely to be
+# opened next), their views are prefetched in background
+NEXT_ROUTES: Dict[str, Callable[[ft.Page, Dict[str, str]], List[str]]] = {
+    "/otpauth": lambda page, params: ["/menu"],
+    "/menu": lambda page, params: [
+        f"/chat/{chat["id"]}"
+        for chat in page.chat_registry.chats if chat["pinned"]
+    ][:3],
+    "/chat/:chat_id": lambda page, params: [
+        f"/profile/{params["chat_id"]}"
+    ]
+}
+
+def match_route(route: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Function to find the route template of a route
+
+    :params: route = Requested route (e.g. /chat/1172859817)
+    :return: Route template and it's parameters
+    """
+    template: ft.TemplateRoute = ft.TemplateRoute(route)
+    for pattern in ROUTES:
+        if template.match(pattern):
+            return pattern, {
+                part[1:]: getattr(template, part[1:])
+                for part in pattern.split("/") if part.startswith(":")
+            }
+    raise KeyError(route)
+
+def build_view(page: ft.Page, route: str) -> ft.View:
+    """
+    Function to build the view of requested route (without
+    view cache, used by prefetcher)
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: View of the route
+    """
+    pattern, params = match_route(route)
+    return ROUTES[pattern](page, **params)
+
+def view_stamp(page: ft.Page, route: str) -> Hashable:
+    """
+    Function to return state of page the view of route is
+    built from
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: State stamp
+    """
+    pattern, params = match_route(route)
+    return STAMPS[pattern](page, params) if pattern in STAMPS else None
+
+def is_cached(page: ft.Page, route: str) -> bool:
+    """
+    Function to check if the view of requested route is cached
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: True if view is cached
+    """
+    pattern, params = match_route(route)
+    return pattern in CACHE_KEYS and page.view_cache.has(
+        pattern, CACHE_KEYS[pattern](params)
+    )
+
+def prefetch_next(page: ft.Page, route: str) -> NoReturn:
+    """
+    Function to prefetch views of routes which are likely to
+    be opened after requested route
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: None
+    """
+    pattern, params = match_route(route)
+    if pattern in NEXT_ROUTES:
+        page.prefetcher.prefetch(*NEXT_ROUTES[pattern](page, params))
+
+def view_handler(page: ft.Page, route: str) -> ft.View:
+    """
+    Function to return the view of requested route, cached and
+    prefetched views are reused instead of being built again
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: View of the route
+    """
+    pattern, params = match_route(route)
+
+    # Adopt prefetched view or build it if route is not cacheable
+    if pattern not in CACHE_KEYS:
+        return page.prefetcher.adopt(route) or ROUTES[pattern](
+            page, **params
         )
-    }
\ No newline at end of file
+
+    # Return cached view or build and cache it
+    key: Hashable = CACHE_KEYS[pattern](params)
+    view: Optional[ft.View] = page.view_cache.get(pattern, key)
+    if view is None:
+        view = page.prefetcher.adopt(route) or ROUTES[pattern](
+            page, **params
+        )
+        page.view_cache.track_scroll(view)
+        page.view_cache.put(pattern, key, view)
+    return view
+
+def route_stack(page: ft.Page, route: str) -> List[str]:
+    """
+    Function to return routes stack of requested route (the
+    requested route on top of it's parents)
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: List of routes
+    """
+    pattern, params = match_route(route)
+
+    # Add parent routes under the route
+    if pattern in PARENTS:
+        return route_stack(page, PARENTS[pattern](page, params)) + [route]
+    return [route]
+
+def in_place(page: ft.Page, view: ft.View, route: str) -> bool:
+    """
+    Function to check if a view on page can stay in place for
+    requested route (same route and not invalidated in cache)
+
+    :params:
+        page  = Flet Page Layout
+        view  = View on page
+        route = Requested route
+
+    :return: True if view can stay
+    """
+    if view.route != route:
+        return False
+
+    pattern, params = match_route(route)
+    return pattern not in CACHE_KEYS or page.view_cache.get(
+        pattern, CACHE_KEYS[pattern](params)
+    ) is view
+
+def reconcile_views(page: ft.Page, route: str) -> List[ft.View]:
+    """
+    Function to turn page views into views stack of requested
+    route, views which are already in place (same route at same
+    position and not invalidated) are kept, so only new views are
+    sent to client
+
+    :params:
+        page  = Flet Page Layout
+        route = Requested route
+
+    :return: List of newly added views
+    """
+    routes: List[str] = route_stack(page, route)
+
+    # Find how many views at bottom of stack are still in place
+    kept: int = 0
+    while (
+        kept < min(len(routes), len(page.views))
+        and in_place(page, page.views[kept], routes[kept])
+    ):
+        kept += 1
+
+    # Build the rest of the stack before touching page views
+    added: List[ft.View] = [
+        view_handler(page, path) for path in routes[kept:]
+    ]
+    del page.views[kept:]
+    page.views.extend(added)
+    return added